@@ -259,7 +259,15 @@ def scan(
         if json:
             output = render_json(filtered_report)
         else:
-            output = render_human(filtered_report, group_by_vendor=group_by_vendor)
+            # Skip the heavy Detailed Analysis panels when stdout is piped
+            # (CI logs, grep); explicit --out file reports keep full detail.
+            # ANSI color only makes sense when stdout is an actual terminal.
+            output = render_human(
+                filtered_report,
+                group_by_vendor=group_by_vendor,
+                detailed=bool(out) or sys.stdout.isatty(),
+                color=out is None and sys.stdout.isatty()
+            )
     except Exception as e:
         print(f"Rendering failed: {e}", file=sys.stderr)
         sys.exit(3)
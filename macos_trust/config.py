@@ -35,7 +35,11 @@ class Config:
     trust_app_store: bool = True
     trust_old_apps: bool = False
     old_app_days: int = 30
-    
+
+    # Lazily built frozenset mirror of trusted_vendors (see trusted_vendor_set)
+    _trusted_set: frozenset[str] | None = field(default=None, repr=False, compare=False)
+    _trusted_src: tuple[str, ...] | None = field(default=None, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         # Validate ignore_patterns are valid regex
@@ -45,6 +49,22 @@ class Config:
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern '{pattern}': {e}")
 
+    def trusted_vendor_set(self) -> frozenset[str]:
+        """
+        Trusted vendor Team IDs as a frozenset for O(1) membership checks.
+
+        The analyzers test membership once per scanned item, so a linear
+        scan of the list would repeat per app. The set is rebuilt whenever
+        trusted_vendors no longer matches the snapshot it was built from
+        (the CLI extends trusted_vendors with --trust-vendor after
+        loading), so any mutation of the list invalidates the cache.
+        """
+        src = tuple(self.trusted_vendors)
+        if self._trusted_set is None or src != self._trusted_src:
+            self._trusted_set = frozenset(src)
+            self._trusted_src = src
+        return self._trusted_set
+
 
 def load_config(config_path: Path | str | None = None) -> Config:
     """
@@ -2,6 +2,7 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Any
@@ -112,6 +113,19 @@ class AppContext:
             self.quarantine_source = source
 
 
+@lru_cache(maxsize=4096)
+def get_app_context(app_path: str) -> AppContext:
+    """
+    Get the (cached) AppContext for a path.
+
+    Building an AppContext stats the bundle and probes for an App Store
+    receipt, so repeated lookups for the same path (helpers inside one
+    bundle, re-analysis passes) would repeat filesystem I/O. Callers must
+    treat the returned context as read-only -- it is shared.
+    """
+    return AppContext(app_path)
+
+
 def parse_quarantine_source(quarantine_value: str) -> str | None:
     """
     Extract the source application from a quarantine attribute value.
@@ -137,10 +151,18 @@ def parse_quarantine_source(quarantine_value: str) -> str | None:
     return None
 
 
+def is_homebrew_source(source: str | None) -> bool:
+    """Check if an already-parsed quarantine source is Homebrew Cask.
+
+    Split out so callers that need both the source name and the Homebrew
+    test (the quarantine rules) can parse the attribute value once.
+    """
+    return source is not None and 'homebrew' in source.lower()
+
+
 def is_homebrew_quarantine(quarantine_value: str) -> bool:
     """Check if quarantine source is Homebrew Cask."""
-    source = parse_quarantine_source(quarantine_value)
-    return source is not None and 'homebrew' in source.lower()
+    return is_homebrew_source(parse_quarantine_source(quarantine_value))
 
 
 def is_browser_quarantine(quarantine_value: str) -> bool:
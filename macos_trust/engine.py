@@ -17,7 +17,13 @@ from macos_trust.collectors.codesign import codesign_verify
 from macos_trust.collectors.spctl import spctl_assess
 from macos_trust.collectors.quarantine import get_quarantine
 from macos_trust.collectors.entitlements import get_entitlements
-from macos_trust.rules import analyze_app, analyze_launchd, analyze_kext, analyze_browser_extension
+from macos_trust.rules import (
+    analyze_app,
+    analyze_apps_batch,
+    analyze_launchd,
+    analyze_kext,
+    analyze_browser_extension,
+)
 from macos_trust.config import Config
 
 
@@ -141,9 +147,14 @@ def _scan_and_analyze_apps(config: Config | None = None, parallel: bool = False)
 
 
 def _analyze_apps_sequential(apps: list[dict], config: Config | None, console: Console) -> list[Finding]:
-    """Analyze apps sequentially (original behavior)."""
-    findings: list[Finding] = []
-    
+    """Analyze apps sequentially, batching the rule evaluation."""
+    # Run the collectors per app under the progress bar, accumulating the
+    # columnar result lists that analyze_apps_batch consumes in one pass
+    codesign_results: list[dict | None] = []
+    spctl_results: list[dict | None] = []
+    quarantine_results: list[dict | None] = []
+    entitlements_results: list[dict | None] = []
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[bold cyan]{task.description}"),
@@ -154,22 +165,30 @@ def _analyze_apps_sequential(apps: list[dict], config: Config | None, console: C
         transient=False
     ) as progress:
         task = progress.add_task(f"Analyzing applications...", total=len(apps))
-        
+
         for app in apps:
             app_name = app.get('name', 'Unknown')
             progress.update(task, description=f"Analyzing [cyan]{app_name}[/cyan]...")
-            
-            try:
-                app_findings = _analyze_single_app(app, config)
-                findings.extend(app_findings)
-            except Exception:
-                # Skip this app if analysis fails completely
-                # This ensures one bad app doesn't stop the entire scan
-                pass
-            
+
+            codesign_result, spctl_result, quarantine_result, entitlements_result = \
+                _collect_app_results(app)
+            codesign_results.append(codesign_result)
+            spctl_results.append(spctl_result)
+            quarantine_results.append(quarantine_result)
+            entitlements_results.append(entitlements_result)
+
             progress.advance(task)
-    
-    return findings
+
+    # analyze_apps_batch isolates rule failures per app, so one bad app
+    # doesn't stop the entire scan
+    return analyze_apps_batch(
+        apps,
+        codesign_results,
+        spctl_results,
+        quarantine_results,
+        entitlements_results,
+        config
+    )
 
 
 def _analyze_apps_parallel(apps: list[dict], config: Config | None, console: Console) -> list[Finding]:
@@ -217,51 +236,70 @@ def _analyze_apps_parallel(apps: list[dict], config: Config | None, console: Con
     return findings
 
 
-def _analyze_single_app(app: dict, config: Config | None = None) -> list[Finding]:
+def _collect_app_results(
+    app: dict
+) -> tuple[dict | None, dict | None, dict | None, dict | None]:
     """
-    Analyze a single application with all collectors.
-    
+    Run all collectors for a single application.
+
     Args:
         app: Application record from scan_applications()
-        config: Configuration for scan behavior
-    
+
     Returns:
-        List of findings for this application
+        (codesign, spctl, quarantine, entitlements) results; each entry is
+        None when the app has no executable or that collector failed
     """
     # Only run collectors if we have an executable path
     exec_path = app.get("exec_path", "")
-    
+
     if not exec_path:
         # No executable to analyze
-        return []
-    
+        return None, None, None, None
+
     # Run collectors (each returns a dict, never throws)
     codesign_result = None
     spctl_result = None
     quarantine_result = None
     entitlements_result = None
-    
+
     try:
         codesign_result = codesign_verify(exec_path)
     except Exception:
         # Collector failed, but we continue with other collectors
         pass
-    
+
     try:
         spctl_result = spctl_assess(exec_path)
     except Exception:
         pass
-    
+
     try:
         quarantine_result = get_quarantine(exec_path)
     except Exception:
         pass
-    
+
     try:
         entitlements_result = get_entitlements(exec_path)
     except Exception:
         pass
-    
+
+    return codesign_result, spctl_result, quarantine_result, entitlements_result
+
+
+def _analyze_single_app(app: dict, config: Config | None = None) -> list[Finding]:
+    """
+    Analyze a single application with all collectors.
+
+    Args:
+        app: Application record from scan_applications()
+        config: Configuration for scan behavior
+
+    Returns:
+        List of findings for this application
+    """
+    codesign_result, spctl_result, quarantine_result, entitlements_result = \
+        _collect_app_results(app)
+
     # Apply rules to generate findings
     try:
         findings = analyze_app(
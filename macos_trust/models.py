@@ -54,7 +54,7 @@ class Risk(str, Enum):
         return cls.INFO
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Individual security finding."""
     
@@ -78,7 +78,7 @@ class Finding:
         return json.dumps(self.model_dump(), sort_keys=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class HostInfo:
     """Host system information."""
     
@@ -92,7 +92,7 @@ class HostInfo:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanReport:
     """Complete scan report with findings."""
     
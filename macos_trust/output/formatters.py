@@ -1,25 +1,48 @@
 """Output formatting for scan results."""
 
 import json
+import sys
 from typing import List, Dict, Any
 from datetime import datetime
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+
+# Rich is imported lazily inside format_human so JSON-only invocations
+# (the common case for automation) don't pay its import cost at startup.
 
 
 SCHEMA_VERSION = "1.0.0"
 
+# Shared status glyphs, built on first use. Passing pre-styled Text objects
+# to add_row skips Rich's markup parser for every cell (Rich copies them on
+# render, so the shared instances are safe to reuse across rows).
+_STATUS_GLYPHS: tuple | None = None
+
+
+def _get_status_glyphs() -> tuple:
+    """Return (ok_green, ok_yellow, bad_red, bad_yellow, bad_green) Text glyphs."""
+    global _STATUS_GLYPHS
+    if _STATUS_GLYPHS is None:
+        from rich.text import Text
+        _STATUS_GLYPHS = (
+            Text("✓", style="green"),
+            Text("✓", style="yellow"),
+            Text("✗", style="red"),
+            Text("✗", style="yellow"),
+            Text("✗", style="green"),
+        )
+    return _STATUS_GLYPHS
+
 
-def format_json(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> str:
+def format_json(results: List[Dict[str, Any]], metadata: Dict[str, Any], pretty: bool = False) -> str:
     """
     Format scan results as JSON with versioned schema.
-    
+
     Args:
         results: List of scan results
         metadata: Scan metadata (timestamp, version, etc.)
-    
+        pretty: If True, indent output for human readers. Defaults to
+            compact output, which is faster to encode and roughly half
+            the byte count for machine consumers.
+
     Returns:
         JSON string
     """
@@ -28,8 +51,10 @@ def format_json(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> str:
         "metadata": metadata,
         "results": results
     }
-    
-    return json.dumps(output, indent=2, sort_keys=True)
+
+    if pretty:
+        return json.dumps(output, indent=2, sort_keys=True)
+    return json.dumps(output, sort_keys=True, separators=(",", ":"))
 
 
 def format_human(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> None:
@@ -40,6 +65,10 @@ def format_human(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Non
         results: List of scan results
         metadata: Scan metadata
     """
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+
     console = Console()
     
     # Header
@@ -66,10 +95,15 @@ def format_human(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Non
     summary_table.add_column("Check", style="cyan")
     summary_table.add_column("Count", justify="right", style="green")
     
-    summary_table.add_row("Signed", str(signed_count))
-    summary_table.add_row("Valid Signature", str(valid_count))
-    summary_table.add_row("Gatekeeper Accepted", str(accepted_count))
-    summary_table.add_row("Quarantined", str(quarantined_count))
+    # Bulk-add the fixed summary rows in one pass
+    summary_rows = (
+        ("Signed", str(signed_count)),
+        ("Valid Signature", str(valid_count)),
+        ("Gatekeeper Accepted", str(accepted_count)),
+        ("Quarantined", str(quarantined_count)),
+    )
+    for row in summary_rows:
+        summary_table.add_row(*row)
     
     console.print(Panel(summary_table, title="[bold]Summary[/bold]"))
     console.print()
@@ -83,35 +117,38 @@ def format_human(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Non
     table.add_column("Gatekeeper", justify="center")
     table.add_column("Quarantine", justify="center")
     
+    # Precompute all rows in one pass, hoisting dict lookups into locals,
+    # then add them in a single tight loop
+    ok_green, ok_yellow, bad_red, bad_yellow, bad_green = _get_status_glyphs()
+    rows = []
     for result in results:
         item = result.get("item", {})
-        name = item.get("name", "unknown")
-        item_type = item.get("type", "unknown")
-        
         codesign = result.get("codesign", {})
         spctl = result.get("spctl", {})
         quarantine = result.get("quarantine", {})
-        
-        # Format status indicators
-        signed = "✓" if codesign.get("signed") else "✗"
-        valid = "✓" if codesign.get("valid") else "✗"
-        accepted = "✓" if spctl.get("accepted") else "✗"
-        quarantined = "✓" if quarantine.get("quarantined") else "✗"
-        
-        # Color code based on status
-        signed_style = "green" if codesign.get("signed") else "red"
-        valid_style = "green" if codesign.get("valid") else "red"
-        accepted_style = "green" if spctl.get("accepted") else "yellow"
-        quarantined_style = "yellow" if quarantine.get("quarantined") else "green"
-        
-        table.add_row(
-            name,
+
+        signed = codesign.get("signed")
+        valid = codesign.get("valid")
+        accepted = spctl.get("accepted")
+        quarantined = quarantine.get("quarantined")
+
+        item_type = item.get("type", "unknown")
+        if type(item_type) is str:
+            # Dedupe the handful of repeated type strings ("app", "kext", ...)
+            item_type = sys.intern(item_type)
+
+        # Format status indicators with color coding
+        rows.append((
+            item.get("name", "unknown"),
             item_type,
-            f"[{signed_style}]{signed}[/{signed_style}]",
-            f"[{valid_style}]{valid}[/{valid_style}]",
-            f"[{accepted_style}]{accepted}[/{accepted_style}]",
-            f"[{quarantined_style}]{quarantined}[/{quarantined_style}]"
-        )
+            ok_green if signed else bad_red,
+            ok_green if valid else bad_red,
+            ok_green if accepted else bad_yellow,
+            ok_yellow if quarantined else bad_green
+        ))
+
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     console.print()
@@ -147,14 +184,26 @@ def format_human(results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Non
         console.print()
 
 
-def save_json(results: List[Dict[str, Any]], metadata: Dict[str, Any], output_file: str) -> None:
+def save_json(results: List[Dict[str, Any]], metadata: Dict[str, Any], output_file: str, pretty: bool = False) -> None:
     """
     Save scan results to a JSON file.
-    
+
     Args:
         results: List of scan results
         metadata: Scan metadata
         output_file: Path to output file
+        pretty: If True, indent output for human readers (compact by default)
     """
+    output = {
+        "schema_version": SCHEMA_VERSION,
+        "metadata": metadata,
+        "results": results
+    }
+
+    # Stream directly to the file handle instead of building an
+    # intermediate string with format_json
     with open(output_file, 'w') as f:
-        f.write(format_json(results, metadata))
+        if pretty:
+            json.dump(output, f, indent=2, sort_keys=True)
+        else:
+            json.dump(output, f, sort_keys=True, separators=(",", ":"))
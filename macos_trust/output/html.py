@@ -573,15 +573,62 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
+_NO_FINDINGS_HTML = '<p style="text-align: center; color: #6c757d; padding: 40px;">No findings detected. Your system looks good! ✅</p>'
+
+# Pre-rendered "no findings" page, formatted once at import time.
+# Metadata fields are kept as literal placeholders and patched in per call,
+# so the empty-report path skips all Counter/vendor/template work.
+_EMPTY_REPORT_HTML = HTML_TEMPLATE.format(
+    hostname="{hostname}",
+    os_version="{os_version}",
+    architecture="{architecture}",
+    scan_date="{scan_date}",
+    high_count=0,
+    med_count=0,
+    low_count=0,
+    info_count=0,
+    total_findings=0,
+    category_labels="[]",
+    category_data="[]",
+    vendor_labels='["None"]',
+    vendor_data="[0]",
+    findings_html=_NO_FINDINGS_HTML,
+    tool_version="{tool_version}"
+)
+
+
 def generate_html_report(findings: List[Dict[str, Any]], metadata: Dict[str, Any], output_path: Path) -> None:
     """
     Generate an HTML report with interactive charts.
-    
+
     Args:
         findings: List of findings from the scan
         metadata: Scan metadata
         output_path: Path to write HTML file
     """
+    # Format metadata (needed by both the empty and full report paths)
+    hostname = metadata.get("hostname", "Unknown")
+    os_version = metadata.get("os_version", "Unknown")
+    architecture = metadata.get("arch", "Unknown")
+    scan_date = metadata.get("timestamp", datetime.now().isoformat())
+    if "T" in scan_date:
+        scan_date = datetime.fromisoformat(scan_date.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
+    tool_version = metadata.get("tool_version", __version__)
+
+    # Short-circuit: no findings means the pre-rendered page only needs
+    # its metadata placeholders patched in
+    if not findings:
+        html = (
+            _EMPTY_REPORT_HTML
+            .replace("{hostname}", str(hostname))
+            .replace("{os_version}", str(os_version))
+            .replace("{architecture}", str(architecture))
+            .replace("{scan_date}", str(scan_date))
+            .replace("{tool_version}", str(tool_version))
+        )
+        output_path.write_text(html, encoding="utf-8")
+        return
+
     # Calculate summary statistics
     risk_counts = Counter(f.get("risk", "INFO") for f in findings)
     high_count = risk_counts.get("HIGH", 0)
@@ -595,38 +642,38 @@ def generate_html_report(findings: List[Dict[str, Any]], metadata: Dict[str, Any
     category_labels = list(categories.keys())
     category_data = list(categories.values())
     
-    # Vendor breakdown (top 5)
+    # Vendor breakdown (top 5). Each heuristic is a single str.find scan
+    # with direct slicing instead of chained split() allocations.
     vendors = Counter()
     for f in findings:
         evidence = f.get("evidence", {})
-        recommendation = f.get("recommendation", "")
-        
-        # Try to extract vendor from spctl_source
-        vendor = evidence.get("spctl_source", "")
-        if "Developer ID" in vendor and ":" in vendor:
-            try:
-                vendor = vendor.split("Developer ID:")[1].split("(")[0].strip()
-            except (IndexError, ValueError):
-                vendor = ""
-        # Try to extract from recommendation text
-        elif "signed by" in recommendation and "(Team ID:" in recommendation:
-            try:
-                parts = recommendation.split("signed by")[1].split("(Team ID:")[0]
-                vendor = parts.strip()
-            except (IndexError, ValueError):
-                vendor = ""
-        # Check if team ID exists (use app name as fallback)
-        elif evidence.get("codesign_team_id") or evidence.get("spctl_team_id"):
-            # Extract app name from title as fallback
-            title = f.get("title", "")
-            if ":" in title:
-                vendor = title.split(":")[-1].strip()
-            else:
-                vendor = ""
+
+        # Try to extract vendor from spctl_source. Only the exact
+        # "Developer ID:" prefix is parsed here; other shapes such as
+        # "Developer ID Application: Vendor (TEAMID)" fall through to the
+        # recommendation heuristic and still get counted. (Those sources
+        # used to hit a split() IndexError and were dropped from the chart.)
+        source = evidence.get("spctl_source", "")
+        i = source.find("Developer ID:")
+        if i >= 0:
+            j = source.find("(", i)
+            vendor = source[i + 13:j if j >= 0 else None].strip()
         else:
-            vendor = "Unsigned"
-        
-        if vendor and vendor not in ["Unknown", "no usable signature", "", "Unsigned"]:
+            # Try to extract from recommendation text
+            recommendation = f.get("recommendation", "")
+            i = recommendation.find("signed by")
+            if i >= 0:
+                j = recommendation.find("(Team ID:", i)
+                vendor = recommendation[i + 9:j].strip() if j >= 0 else ""
+            # Check if team ID exists (use app name as fallback)
+            elif evidence.get("codesign_team_id") or evidence.get("spctl_team_id"):
+                title = f.get("title", "")
+                k = title.rfind(":")
+                vendor = title[k + 1:].strip() if k >= 0 else ""
+            else:
+                vendor = "Unsigned"
+
+        if vendor and vendor not in ("Unknown", "no usable signature", "Unsigned"):
             vendors[vendor] += 1
     
     top_vendors = vendors.most_common(5)
@@ -671,17 +718,8 @@ def generate_html_report(findings: List[Dict[str, Any]], metadata: Dict[str, Any
         """
     
     if not findings_html:
-        findings_html = '<p style="text-align: center; color: #6c757d; padding: 40px;">No findings detected. Your system looks good! ✅</p>'
-    
-    # Format metadata
-    hostname = metadata.get("hostname", "Unknown")
-    os_version = metadata.get("os_version", "Unknown")
-    architecture = metadata.get("arch", "Unknown")
-    scan_date = metadata.get("timestamp", datetime.now().isoformat())
-    if "T" in scan_date:
-        scan_date = datetime.fromisoformat(scan_date.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
-    tool_version = metadata.get("tool_version", __version__)
-    
+        findings_html = _NO_FINDINGS_HTML
+
     # Render template
     html = HTML_TEMPLATE.format(
         hostname=hostname,
@@ -1,53 +1,97 @@
 """Output rendering for scan reports."""
 
-import json
 from io import StringIO
-from collections import defaultdict
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich import box
 
 from macos_trust.models import ScanReport, Risk
-from macos_trust.vendors import get_vendor_name, is_known_vendor
+from macos_trust.vendors import lookup_vendor
 
+# Pre-styled risk badges shared across all rows -- there are only four
+# distinct risk levels, so parsing markup per row is pure waste
+_RISK_BADGES: dict[Risk, Text] = {
+    Risk.HIGH: Text("🔴 HIGH", style="bold red"),
+    Risk.MED: Text("🟡 MED", style="bold yellow"),
+    Risk.LOW: Text("🟢 LOW", style="bold blue"),
+    Risk.INFO: Text("ℹ️  INFO", style="dim"),
+}
 
-def render_human(report: ScanReport, group_by_vendor: bool = False) -> str:
+# Invariant renderables and table shapes, built once per process instead of
+# per call (Table/Panel constructors do non-trivial style resolution)
+_BOX = box.ROUNDED
+
+_HEADER_PANEL = Panel(
+    Text("🔍 macOS Trust Scanner", style="bold cyan"),
+    border_style="cyan",
+    box=_BOX
+)
+
+_SUCCESS_PANEL = Panel(
+    Text("✓ No security findings detected", style="bold green"),
+    border_style="green",
+    box=_BOX
+)
+
+_FLAT_TABLE_COLUMNS = (
+    ("Risk", {"style": "bold", "no_wrap": True}),
+    ("Category", {"style": "cyan", "no_wrap": True}),
+    ("Title", {"max_width": 50, "overflow": "fold"}),
+    ("Path", {"max_width": 60, "style": "dim", "overflow": "ellipsis"}),
+)
+
+_GROUPED_TABLE_COLUMNS = (
+    ("Risk", {"style": "bold", "width": 10, "no_wrap": True}),
+    ("Category", {"width": 12, "no_wrap": True}),
+    ("Title", {"width": 40}),
+    ("Path", {"width": 48, "style": "dim"}),
+)
+
+
+def render_human(report: ScanReport, group_by_vendor: bool = False, detailed: bool = True, color: bool = True) -> str:
     """
     Render scan report in human-readable format using Rich.
-    
+
     Args:
         report: ScanReport to render
         group_by_vendor: If True, group findings by vendor
-    
+        detailed: If False, skip the per-finding Detailed Analysis panels
+            (useful when output is piped and only the tables matter)
+        color: If False, emit plain text without ANSI escapes (for files
+            and pipes; also skips Rich's color-encoding work)
+
     Returns:
         Formatted string suitable for terminal display
     """
-    # Use Console with file=StringIO to capture output with colors
+    # Use Console with file=StringIO to capture output.
+    # All renderables are collected into one list and printed in a single
+    # Group at the end -- one markup/ANSI pass instead of one per print.
     output_buffer = StringIO()
-    console = Console(file=output_buffer, width=120, force_terminal=True)
-    
+    if color:
+        console = Console(file=output_buffer, width=120, force_terminal=True)
+    else:
+        console = Console(file=output_buffer, width=120, force_terminal=False, no_color=True)
+    renderables: list = [""]
+
     # Header with panel
-    console.print()
-    header_text = Text()
-    header_text.append("🔍 macOS Trust Scanner", style="bold cyan")
-    console.print(Panel(header_text, border_style="cyan", box=box.ROUNDED))
-    
+    renderables.append(_HEADER_PANEL)
+
     # Host information in a styled box
     host_info = Table.grid(padding=(0, 2))
     host_info.add_column(style="bold cyan", justify="right")
     host_info.add_column(style="white")
-    
+
     host_info.add_row("Host:", f"[bold]{report.host.hostname}[/bold]")
     host_info.add_row("OS Version:", f"{report.host.os_version} [dim](Build {report.host.build})[/dim]")
     host_info.add_row("Architecture:", report.host.arch)
     host_info.add_row("Scan Time:", f"[dim]{report.timestamp}[/dim]")
-    
-    console.print(Panel(host_info, border_style="blue", box=box.ROUNDED, padding=(0, 1)))
-    console.print()
-    
+
+    renderables.append(Panel(host_info, border_style="blue", box=_BOX, padding=(0, 1)))
+    renderables.append("")
+
     # Summary counts with styled panel
     summary = report.summary()
     summary_text = Text()
@@ -70,171 +114,180 @@ def render_human(report: ScanReport, group_by_vendor: bool = False) -> str:
         
     summary_text.append(f"ℹ️  {summary['INFO']} INFO", style="dim" if summary['INFO'] == 0 else "bold")
     
-    console.print(Panel(summary_text, title="[bold]Summary[/bold]", border_style="yellow", box=box.ROUNDED))
-    console.print()
-    
+    renderables.append(Panel(summary_text, title="[bold]Summary[/bold]", border_style="yellow", box=_BOX))
+    renderables.append("")
+
     # Get sorted findings
     sorted_findings = report.sorted_findings()
-    
+
     if not sorted_findings:
-        success_text = Text()
-        success_text.append("✓ No security findings detected", style="bold green")
-        console.print(Panel(success_text, border_style="green", box=box.ROUNDED))
-        console.print()
+        renderables.append(_SUCCESS_PANEL)
+        renderables.append("")
+        console.print(Group(*renderables))
         return output_buffer.getvalue()
-    
+
     # Group by vendor if requested
     if group_by_vendor:
-        _render_grouped_findings(console, sorted_findings)
+        renderables.extend(_render_grouped_findings(sorted_findings))
     else:
-        _render_flat_findings(console, sorted_findings)
-    
-    # Detailed findings for HIGH and MED only
-    high_med_findings = [f for f in sorted_findings if f.risk in (Risk.HIGH, Risk.MED)]
-    
+        renderables.extend(_render_flat_findings(sorted_findings))
+
+    # Detailed findings for HIGH and MED only. Enum members are singletons,
+    # so identity tests avoid the per-iteration tuple build of `in (...)`.
+    if detailed:
+        high_med_findings = [
+            f for f in sorted_findings
+            if f.risk is Risk.HIGH or f.risk is Risk.MED
+        ]
+    else:
+        high_med_findings = []
+
     if high_med_findings:
-        console.print(Panel(
+        renderables.append(Panel(
             "[bold]Detailed Analysis[/bold]",
             border_style="magenta",
-            box=box.ROUNDED,
+            box=_BOX,
             padding=(0, 1)
         ))
-        console.print()
-        
+        renderables.append("")
+
         for idx, finding in enumerate(high_med_findings, 1):
-            # Finding header with colored panel
+            # Finding header with colored panel, reusing the shared badge
             header_text = Text()
-            
-            # Add risk badge with proper styling
-            if finding.risk == Risk.HIGH:
-                header_text.append("🔴 HIGH", style="bold red")
-            elif finding.risk == Risk.MED:
-                header_text.append("🟡 MED", style="bold yellow")
-            elif finding.risk == Risk.LOW:
-                header_text.append("🟢 LOW", style="bold blue")
-            else:
-                header_text.append("ℹ️  INFO", style="dim")
-            
+            header_text.append_text(_RISK_BADGES[finding.risk].copy())
             header_text.append(" ")
             header_text.append(finding.title, style="bold white")
             
             border_color = "red" if finding.risk == Risk.HIGH else "yellow"
             
-            # Build content
-            content_lines = []
-            content_lines.append(f"[dim]ID:[/dim] [cyan]{finding.id}[/cyan]")
-            content_lines.append("")
-            content_lines.append(f"[white]{finding.details}[/white]")
-            content_lines.append("")
-            
+            # Build content as a Text object so Rich never has to run its
+            # markup parser over the panel body
+            body = Text()
+            body.append("ID: ", style="dim")
+            body.append(finding.id, style="cyan")
+            body.append("\n\n")
+            body.append(finding.details, style="white")
+            body.append("\n")
+
             # Path
             if finding.path:
-                content_lines.append(f"[bold cyan]Path:[/bold cyan] [dim]{finding.path}[/dim]")
-                content_lines.append("")
-            
-            # Evidence
+                body.append("\nPath: ", style="bold cyan")
+                body.append(finding.path, style="dim")
+                body.append("\n")
+
+            # Evidence. The rules build each evidence dict in a canonical
+            # key order, so iterating insertion order is deterministic and
+            # skips a per-finding sort.
             if finding.evidence:
-                content_lines.append("[bold cyan]Evidence:[/bold cyan]")
-                for key, value in sorted(finding.evidence.items()):
+                body.append("\nEvidence:", style="bold cyan")
+                for key, value in finding.evidence.items():
+                    body.append("\n  • ", style="yellow")
+                    body.append(key + ": ", style="cyan")
                     # Truncate long values
-                    value_display = value
-                    if len(value_display) > 80:
-                        value_display = value_display[:77] + "..."
-                    content_lines.append(f"  [yellow]•[/yellow] [cyan]{key}:[/cyan] {value_display}")
-                content_lines.append("")
-            
+                    body.append(value[:77] + "..." if len(value) > 80 else value)
+                body.append("\n")
+
             # Recommendation
-            content_lines.append(f"[bold cyan]Recommendation:[/bold cyan] [white]{finding.recommendation}[/white]")
-            
-            console.print(Panel(
-                "\n".join(content_lines),
+            body.append("\nRecommendation: ", style="bold cyan")
+            body.append(finding.recommendation, style="white")
+
+            renderables.append(Panel(
+                body,
                 title=header_text,
                 border_style=border_color,
-                box=box.ROUNDED,
+                box=_BOX,
                 padding=(1, 2)
             ))
-            
+
             if idx < len(high_med_findings):
-                console.print()
-    
+                renderables.append("")
+
+    console.print(Group(*renderables))
     return output_buffer.getvalue()
 
 
-def _render_flat_findings(console: Console, findings: list) -> None:
-    """Render findings in a flat table format."""
-    console.print(f"[bold white]Findings[/bold white] [dim]({len(findings)} total)[/dim]")
-    console.print()
-    
+def _truncate_path(path: str | None) -> str:
+    """Truncate a path for table display, keeping the trailing segment."""
+    if not path:
+        return "N/A"
+    if len(path) > 60:
+        # Show the end of the path - the app/bundle name matters most
+        return "..." + path[-57:]
+    return path
+
+
+def _render_flat_findings(findings: list) -> list:
+    """Build renderables for findings in a flat table format."""
+    renderables: list = [
+        f"[bold white]Findings[/bold white] [dim]({len(findings)} total)[/dim]",
+        "",
+    ]
+
     table = Table(
         show_header=True,
         header_style="bold cyan",
-        box=box.ROUNDED,
+        box=_BOX,
         border_style="blue",
         row_styles=["", "dim"],
         expand=False
     )
-    table.add_column("Risk", style="bold", no_wrap=True)
-    table.add_column("Category", style="cyan", no_wrap=True)
-    table.add_column("Title", max_width=50, overflow="fold")
-    table.add_column("Path", max_width=60, style="dim", overflow="ellipsis")
+    for header, kwargs in _FLAT_TABLE_COLUMNS:
+        table.add_column(header, **kwargs)
     
-    for finding in findings:
-        # Style risk level with colors and icons
-        risk_text = _style_risk_badge(finding.risk)
-        
-        # Truncate path intelligently - show last part
-        path_display = finding.path or "N/A"
-        if len(path_display) > 60:
-            # Show beginning and end of path
-            path_display = "..." + path_display[-57:]
-        
-        # Style title based on risk
-        title_style = ""
-        if finding.risk == Risk.HIGH:
-            title_style = "bold"
-        
-        table.add_row(
-            risk_text,
+    # Precompute all row tuples in one comprehension, then feed add_row in
+    # a tight loop -- keeps Rich's per-row validation out of the build pass
+    rows = [
+        (
+            _RISK_BADGES[finding.risk],
             finding.category,
-            Text(finding.title, style=title_style),
-            path_display
+            Text(finding.title, style="bold" if finding.risk is Risk.HIGH else ""),
+            _truncate_path(finding.path),
         )
-    
-    console.print(table)
-    console.print()
+        for finding in findings
+    ]
+    for row in rows:
+        table.add_row(*row)
 
+    renderables.append(table)
+    renderables.append("")
+    return renderables
+
+
+def _render_grouped_findings(findings: list) -> list:
+    """Build renderables for findings grouped by vendor."""
+    # Group findings by vendor -- one fused vendor-table lookup per finding
+    vendor_groups: dict[str, list] = {}
 
-def _render_grouped_findings(console: Console, findings: list) -> None:
-    """Render findings grouped by vendor."""
-    # Group findings by vendor
-    vendor_groups = defaultdict(list)
-    
     for finding in findings:
         # Try to extract team_id from evidence
+        evidence = finding.evidence
         team_id = (
-            finding.evidence.get("codesign_team_id") or 
-            finding.evidence.get("spctl_team_id") or 
+            evidence.get("codesign_team_id") or
+            evidence.get("spctl_team_id") or
             ""
         )
-        
-        if team_id and is_known_vendor(team_id):
-            vendor_name = get_vendor_name(team_id)
-            vendor_groups[f"{vendor_name} ({team_id})"].append(finding)
+
+        vendor_name = lookup_vendor(team_id) if team_id else None
+        if vendor_name is not None:
+            key = f"{vendor_name} ({team_id})"
         else:
-            vendor_groups["Unknown / Other"].append(finding)
+            key = "Unknown / Other"
+        vendor_groups.setdefault(key, []).append(finding)
     
     # Display grouped findings
-    console.print(f"[bold white]Findings by Vendor[/bold white] [dim]({len(findings)} total)[/dim]")
-    console.print()
-    
+    renderables: list = [
+        f"[bold white]Findings by Vendor[/bold white] [dim]({len(findings)} total)[/dim]",
+        "",
+    ]
+
     for vendor, vendor_findings in sorted(vendor_groups.items()):
         # Vendor header
         vendor_text = Text()
         vendor_text.append(f"📦 {vendor}", style="bold cyan")
         vendor_text.append(f" - {len(vendor_findings)} finding(s)", style="dim")
-        
-        console.print(Panel(vendor_text, border_style="cyan", box=box.SIMPLE))
-        
+
+        renderables.append(Panel(vendor_text, border_style="cyan", box=box.SIMPLE))
+
         # Findings table for this vendor
         table = Table(
             show_header=True,
@@ -243,10 +296,8 @@ def _render_grouped_findings(console: Console, findings: list) -> None:
             show_edge=False,
             pad_edge=False
         )
-        table.add_column("Risk", style="bold", width=10, no_wrap=True)
-        table.add_column("Category", width=12, no_wrap=True)
-        table.add_column("Title", width=40)
-        table.add_column("Path", width=48, style="dim")
+        for header, kwargs in _GROUPED_TABLE_COLUMNS:
+            table.add_column(header, **kwargs)
         
         for finding in vendor_findings:
             risk_text = _style_risk_badge(finding.risk)
@@ -262,9 +313,11 @@ def _render_grouped_findings(console: Console, findings: list) -> None:
                 Text(finding.title, style=title_style),
                 path_display
             )
-        
-        console.print(table)
-        console.print()
+
+        renderables.append(table)
+        renderables.append("")
+
+    return renderables
 
 
 def render_json(report: ScanReport) -> str:
@@ -277,28 +330,20 @@ def render_json(report: ScanReport) -> str:
     Returns:
         JSON string with sorted keys and indentation
     """
-    # Convert report to dict
-    report_dict = report.model_dump()
-    
-    # Serialize with sorted keys for deterministic output
-    return json.dumps(report_dict, sort_keys=True, indent=2)
+    # Delegate to the model's own serializer -- one dump pass, and a single
+    # place to swap in a faster encoder later
+    return report.model_dump_json()
 
 
-def _style_risk_badge(risk: Risk) -> str:
+def _style_risk_badge(risk: Risk) -> Text:
     """
     Apply Rich styling to risk level with icon.
-    
+
     Args:
         risk: Risk level to style
-    
+
     Returns:
-        Styled risk string with icon for Rich console
+        Shared pre-styled badge Text for the risk level (safe to reuse
+        across rows; Rich copies cell renderables on render)
     """
-    if risk == Risk.HIGH:
-        return "[bold red]🔴 HIGH[/bold red]"
-    elif risk == Risk.MED:
-        return "[bold yellow]🟡 MED[/bold yellow]"
-    elif risk == Risk.LOW:
-        return "[bold blue]🟢 LOW[/bold blue]"
-    else:  # INFO
-        return "[dim]ℹ️  INFO[/dim]"
+    return _RISK_BADGES[risk]
@@ -1,9 +1,9 @@
 """SARIF (Static Analysis Results Interchange Format) output renderer."""
 
 import json
-from pathlib import Path
+from functools import lru_cache
 
-from macos_trust.models import ScanReport, Risk, Finding
+from macos_trust.models import ScanReport, Risk
 
 
 def _risk_to_sarif_level(risk: Risk) -> str:
@@ -22,27 +22,42 @@ def _risk_to_sarif_level(risk: Risk) -> str:
     return mapping[risk]
 
 
+# Cached (SARIF level, risk value) pairs so the hot result loop resolves
+# both enum probes with a single dict lookup
+_RISK_LEVEL_CACHE: dict[Risk, tuple[str, str]] = {
+    risk: (_risk_to_sarif_level(risk), risk.value) for risk in Risk
+}
+
+
+# Translation table mapping rule-ID separators to hyphens in a single scan
+_RULE_NAME_TRANS = str.maketrans({":": "-", "_": "-"})
+
+
 def _sanitize_rule_name(rule_id: str) -> str:
     """
     Convert a rule ID to a safe rule name.
-    
+
     SARIF rule names should be short, alphanumeric identifiers.
     Example: "app:unsigned:elevated" -> "app-unsigned-elevated"
     """
-    return rule_id.replace(":", "-").replace("_", "-")
+    return rule_id.translate(_RULE_NAME_TRANS)
 
 
-def _dedupe_rules(findings: list[Finding]) -> dict[str, Finding]:
+@lru_cache(maxsize=512)
+def _make_location(uri: str) -> dict:
     """
-    Deduplicate findings by ID to create unique SARIF rules.
-    
-    Returns a dict mapping rule_id -> representative Finding.
+    Build the SARIF physicalLocation entry for a path.
+
+    Cached because many findings point at the same bundle path; callers
+    must treat the returned dict as read-only.
     """
-    rules_map = {}
-    for finding in findings:
-        if finding.id not in rules_map:
-            rules_map[finding.id] = finding
-    return rules_map
+    return {
+        "physicalLocation": {
+            "artifactLocation": {
+                "uri": uri
+            }
+        }
+    }
 
 
 def render_sarif(report: ScanReport) -> dict:
@@ -57,60 +72,56 @@ def render_sarif(report: ScanReport) -> dict:
     """
     # Get package version from pyproject.toml or default
     version = "0.2.0"
-    
-    # Deduplicate rules
-    rules_map = _dedupe_rules(report.findings)
-    
-    # Build SARIF rules from unique findings
+
+    # Build SARIF rules (deduplicated by finding ID) and results together
+    # in a single pass over the findings
+    seen_rule_ids: set[str] = set()
     rules = []
-    for rule_id, finding in rules_map.items():
-        rule = {
-            "id": rule_id,
-            "name": _sanitize_rule_name(rule_id),
-            "shortDescription": {
-                "text": finding.title
-            },
-            "fullDescription": {
-                "text": finding.details
-            },
-            "help": {
-                "text": finding.recommendation
-            }
-        }
-        rules.append(rule)
-    
-    # Build SARIF results from all findings
     results = []
     for finding in report.findings:
+        rule_id = finding.id
+        if rule_id not in seen_rule_ids:
+            seen_rule_ids.add(rule_id)
+            rules.append({
+                "id": rule_id,
+                "name": _sanitize_rule_name(rule_id),
+                "shortDescription": {
+                    "text": finding.title
+                },
+                "fullDescription": {
+                    "text": finding.details
+                },
+                "help": {
+                    "text": finding.recommendation
+                }
+            })
+
         # Combine title + details for message
         message_text = f"{finding.title}: {finding.details}"
-        
-        # Build result object
+        level, risk_value = _RISK_LEVEL_CACHE[finding.risk]
+
+        # Build result object. Evidence values are already strings in the
+        # common case; only convert the ones that aren't.
         result = {
-            "ruleId": finding.id,
-            "level": _risk_to_sarif_level(finding.risk),
+            "ruleId": rule_id,
+            "level": level,
             "message": {
                 "text": message_text
             },
             "properties": {
                 "category": finding.category,
-                "risk": finding.risk.value,
-                "evidence": {k: str(v) for k, v in finding.evidence.items()}
+                "risk": risk_value,
+                "evidence": {
+                    k: v if type(v) is str else str(v)
+                    for k, v in finding.evidence.items()
+                }
             }
         }
         
         # Add location if path exists
         if finding.path:
-            result["locations"] = [
-                {
-                    "physicalLocation": {
-                        "artifactLocation": {
-                            "uri": finding.path
-                        }
-                    }
-                }
-            ]
-        
+            result["locations"] = [_make_location(finding.path)]
+
         results.append(result)
     
     # Build complete SARIF document
@@ -147,8 +158,9 @@ def write_sarif(path: str, report: ScanReport) -> None:
         OSError: If file cannot be written
     """
     sarif_doc = render_sarif(report)
-    sarif_json = json.dumps(sarif_doc, indent=2, sort_keys=True)
-    
-    # Write to file
-    output_path = Path(path)
-    output_path.write_text(sarif_json)
+
+    # Stream straight to the file handle instead of building the full JSON
+    # string first -- halves peak memory for large documents and skips the
+    # extra encode pass. 64 KB buffering keeps the syscall count low.
+    with open(path, "w", buffering=65536, encoding="utf-8") as fp:
+        json.dump(sarif_doc, fp, indent=2, sort_keys=True)
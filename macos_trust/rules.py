@@ -1,22 +1,487 @@
 """Security rules for generating findings from collected data."""
 
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import List
 
 from macos_trust.models import Finding, Risk
 from macos_trust.vendors import (
     is_known_vendor,
     get_vendor_name,
+    lookup_vendor,
     is_system_helper_path,
     is_user_writable_path as is_user_writable_location
 )
 from macos_trust.context import (
-    AppContext,
+    get_app_context,
     parse_quarantine_source,
     is_homebrew_quarantine,
+    is_homebrew_source,
     should_trust_by_age
 )
 from macos_trust.config import Config
 
+# Recommendation/detail templates for the hot finding builders. Only the
+# vendor name, team ID, and item name vary between findings, so these are
+# compiled once and filled with a single .format call instead of rebuilding
+# the full string from f-string pieces on every finding.
+# The two single-substitution details are split into prefix/suffix halves
+# so the builders can produce them with one `+` concatenation instead of
+# the .format machinery (the fragments themselves are allocated once here).
+_DETAILS_CS_FAIL_PREFIX = "Code signature verification failed for "
+_DETAILS_CS_FAIL_SUFFIX = (
+    ". This could indicate tampering, corruption, or an unsigned binary."
+)
+_REC_CS_FAIL_KNOWN = (
+    "This item is signed by {vendor} (Team ID: {team_id}), but the signature is invalid. "
+    "This could indicate corruption or tampering. Reinstall from official {vendor} sources."
+)
+_DETAILS_SPCTL_PREFIX = "macOS Gatekeeper has rejected "
+_DETAILS_SPCTL_SUFFIX = (
+    ". This item does not meet Apple's security requirements for execution."
+)
+_REC_SPCTL_HELPER = (
+    "This is a {vendor} system helper (Team ID: {team_id}). "
+    "Helper utilities commonly fail Gatekeeper checks but may be safe if part of a verified {vendor} installation. "
+    "Verify the main {vendor} application is properly installed and up to date."
+)
+_REC_SPCTL_KNOWN = (
+    "This item is signed by {vendor} (Team ID: {team_id}) but rejected by Gatekeeper. "
+    "This may be a helper utility or older version. Verify with official {vendor} documentation."
+)
+_DETAILS_USER_WRITABLE = (
+    "System daemon '{label}' executes a program from a user-writable location ({program}). "
+    "This is a privilege escalation risk, as the daemon runs with elevated privileges "
+    "but its binary could be modified by unprivileged users."
+)
+_DETAILS_QUAR_PERSIST_AUTORUN = (
+    "Launch {scope} '{label}' has the quarantine attribute set and is configured to run at load. "
+    "Quarantined items are typically downloads that haven't been explicitly approved by the user."
+)
+_DETAILS_QUAR_PERSIST = (
+    "Launch {scope} '{label}' has the quarantine attribute set but is not configured for auto-start. "
+    "This is typically from a downloaded item that hasn't been user-approved yet."
+)
+_DETAILS_VERIFIED = (
+    "Application '{name}' is properly signed by {vendor} and passes all "
+    "macOS security requirements including Gatekeeper."
+)
+
+# Invariant recommendation strings (no per-finding substitutions); a single
+# shared object per recommendation instead of a fresh literal per call
+_REC_CS_FAIL_DEFAULT = (
+    "Verify the source of this item. Remove if untrusted. "
+    "Re-download from official sources if legitimate."
+)
+_REC_SPCTL_DEFAULT = (
+    "Do not run this item unless you explicitly trust the source. "
+    "Verify authenticity and consider obtaining from App Store or notarized sources."
+)
+_REC_USER_WRITABLE = (
+    "Move the program to a system-protected location (e.g., /usr/local/bin) with appropriate "
+    "permissions, or remove this launch daemon if it's not needed."
+)
+_REC_QUAR_APP = (
+    "Review this application. If it's legitimate software you downloaded, "
+    "you can remove the quarantine attribute by running it or using: xattr -d com.apple.quarantine"
+)
+_REC_QUAR_PERSIST_AUTORUN = (
+    "Review this persistence item. If legitimate, remove the quarantine attribute. "
+    "If untrusted, remove the launch agent/daemon entirely."
+)
+_REC_QUAR_PERSIST_NORUN = (
+    "Review this item. Quarantine attributes on persistence items without RunAtLoad are lower risk "
+    "since they don't auto-execute. Remove the quarantine if legitimate or delete if unwanted."
+)
+
+
+# Vendor-keyed recommendation caches. A scan of a homogeneous corpus (e.g.
+# dozens of Microsoft or Adobe helpers, all spctl-rejected) formats the
+# exact same recommendation repeatedly; memoizing on (vendor, team_id)
+# makes every repeat a cache hit that shares one string object. Caching
+# whole Finding objects was considered and rejected: the evidence dict is
+# mutable and would be aliased across shallow copies.
+
+@lru_cache(maxsize=256)
+def _rec_cs_fail_known(vendor: str, team_id: str) -> str:
+    return _REC_CS_FAIL_KNOWN.format(vendor=vendor, team_id=team_id)
+
+
+@lru_cache(maxsize=256)
+def _rec_spctl_helper(vendor: str, team_id: str) -> str:
+    return _REC_SPCTL_HELPER.format(vendor=vendor, team_id=team_id)
+
+
+@lru_cache(maxsize=256)
+def _rec_spctl_known(vendor: str, team_id: str) -> str:
+    return _REC_SPCTL_KNOWN.format(vendor=vendor, team_id=team_id)
+
+
+# Interned status sentinels. The collectors emit these exact literals, and
+# short identifier-like literals are interned by the compiler, so comparing
+# against the same interned object short-circuits on pointer identity
+# before any character comparison. Kept as strings rather than IntEnums so
+# the raw collector dicts and finding evidence stay JSON-trivial.
+_STATUS_OK = sys.intern("ok")
+_STATUS_FAIL = sys.intern("fail")
+_STATUS_ACCEPTED = sys.intern("accepted")
+_STATUS_REJECTED = sys.intern("rejected")
+_QUARANTINED_TRUE = sys.intern("true")
+
+
+# Risk downgrade tables. The branchy if/elif ladders in the codesign and
+# Gatekeeper rules all collapse to small functions of a few booleans, so
+# the full decision tables are enumerated at import and the hot path is a
+# single dict probe. Keys not listed fall back to HIGH via .get().
+_CS_FAIL_RISK = {True: Risk.MED, False: Risk.HIGH}
+
+_SPCTL_RISK = {
+    (True, True, True): Risk.MED,   # signed, known vendor, helper
+    (True, True, False): Risk.MED,  # signed, known vendor
+}
+
+# App codesign-fail risk over (known_vendor, is_app_store, old_app):
+# App Store overrides to MED, then config-trusted age downgrades to LOW,
+# otherwise the vendor base risk applies
+_CS_FAIL_RISK_APP = {
+    (kv, app_store, old):
+        Risk.MED if app_store
+        else (Risk.LOW if old else _CS_FAIL_RISK[kv])
+    for kv in (False, True)
+    for app_store in (False, True)
+    for old in (False, True)
+}
+
+# App Gatekeeper-rejection risk over (signed_known_vendor, is_app_store)
+_SPCTL_RISK_APP = {
+    (signed_known, app_store):
+        Risk.MED if (signed_known or app_store) else Risk.HIGH
+    for signed_known in (False, True)
+    for app_store in (False, True)
+}
+
+
+# Finding-ID suffixes: the id_base prefix is formatted once per item, so
+# each rule's ID is a two-string concat instead of an f-string interpolation
+_SUF_CS_FAIL = ":codesign_fail"
+_SUF_SPCTL = ":spctl_rejected"
+_SUF_QUARANTINED = ":quarantined"
+_SUF_QUARANTINED_ONLY = ":quarantined_only"
+_SUF_VERIFIED = ":verified"
+_SUF_HIGH_RISK_ENTS = ":high_risk_entitlements"
+_SUF_SENSITIVE_ENTS = ":sensitive_entitlements"
+_SUF_USER_WRITABLE = ":user_writable"
+
+
+def _cap(s: str, n: int) -> str:
+    """Truncate to n chars, returning s itself (no copy) when it fits."""
+    return s if len(s) <= n else s[:n]
+
+
+def _canonical_path(d: dict) -> str:
+    """Resolve the display path for an item record with one key walk."""
+    for key in ("exec_path", "app_path", "plist_path"):
+        path = d.get(key)
+        if path:
+            return path
+    return ""
+
+
+@dataclass(slots=True)
+class _RuleContext:
+    """
+    Pre-extracted per-item fields shared by every rule.
+
+    Built once per analyzed item so the rules read plain locals instead of
+    re-running dict lookups and vendor-table probes.
+    """
+
+    item: dict
+    codesign_result: dict | None
+    spctl_result: dict | None
+    quarantine_result: dict | None
+    entitlements_result: dict | None
+    config: Config | None
+    id_base: str
+    path: str
+    name: str
+    display_path: str
+    team_id: str
+    cs_status: str | None
+    sp_status: str | None
+    q_is: str | None
+    is_signed: bool
+    known_vendor: bool
+    vendor_name: str | None
+    is_helper: bool
+    scope: str = ""
+    run_at_load: bool = False
+
+
+def _rule_app_codesign_fail(ctx: _RuleContext) -> Finding | None:
+    """Rule 1: Invalid code signature."""
+    if ctx.cs_status != _STATUS_FAIL:
+        return None
+
+    # Risk from the full decision table over (known vendor, App Store,
+    # config-trusted age). The AppContext stat happens only here and in
+    # Rule 2 -- i.e. only when a signature actually failed -- so clean
+    # apps never pay the filesystem probe (lru_cache dedupes between the
+    # two rules and across repeat paths)
+    app_context = get_app_context(ctx.path) if ctx.path else None
+    config = ctx.config
+    is_app_store = app_context.is_app_store if app_context else False
+    old_app = bool(
+        app_context and config and config.trust_old_apps
+        and app_context.age_days >= config.old_app_days
+    )
+    risk = _CS_FAIL_RISK_APP[(ctx.known_vendor, is_app_store, old_app)]
+
+    return _create_codesign_fail_finding(
+        codesign_result=ctx.codesign_result,
+        finding_id=ctx.id_base + _SUF_CS_FAIL,
+        name=ctx.name,
+        path=ctx.display_path,
+        risk=risk,
+        team_id=ctx.team_id,
+        vendor_name=ctx.vendor_name
+    )
+
+
+def _rule_app_spctl_rejected(ctx: _RuleContext) -> Finding | None:
+    """Rule 2: Gatekeeper rejected."""
+    if ctx.sp_status != _STATUS_REJECTED:
+        return None
+
+    # Risk from the decision table: signed known vendors and App Store
+    # apps land on MED, everything else HIGH
+    app_context = get_app_context(ctx.path) if ctx.path else None
+    risk = _SPCTL_RISK_APP[(
+        ctx.is_signed and ctx.known_vendor,
+        app_context.is_app_store if app_context else False,
+    )]
+
+    return _create_spctl_rejected_finding(
+        spctl_result=ctx.spctl_result,
+        finding_id=ctx.id_base + _SUF_SPCTL,
+        name=ctx.name,
+        path=ctx.display_path,
+        risk=risk,
+        team_id=ctx.team_id,
+        vendor_name=ctx.vendor_name,
+        is_helper=ctx.is_helper
+    )
+
+
+def _rule_app_quarantined(ctx: _RuleContext) -> Finding | None:
+    """Rule 3: Quarantined but not auto-run -> LOW (context-aware)."""
+    if ctx.q_is != _QUARANTINED_TRUE:
+        return None
+
+    quarantine_value = ctx.quarantine_result.get("value", "")
+
+    # Parse the attribute value once; the Homebrew suppression and the
+    # finding's source attribution both work from the same parse
+    quarantine_source = parse_quarantine_source(quarantine_value)
+
+    # Skip quarantine findings for Homebrew Cask if configured
+    if ctx.config and ctx.config.trust_homebrew_cask and is_homebrew_source(quarantine_source):
+        return None
+
+    return _create_quarantined_app_finding(
+        app=ctx.item,
+        quarantine_result=ctx.quarantine_result,
+        finding_id=ctx.id_base + _SUF_QUARANTINED,
+        quarantine_source=quarantine_source
+    )
+
+
+def _rule_app_verified(ctx: _RuleContext) -> Finding | None:
+    """Rule 4: Fully verified by known vendor -> INFO."""
+    # sp_status first: it's the most selective test (rejected/missing spctl
+    # results are common), and None statuses already encode missing results
+    if ctx.sp_status != _STATUS_ACCEPTED or not ctx.is_signed or not ctx.known_vendor:
+        return None
+
+    return _create_verified_app_finding(
+        app=ctx.item,
+        codesign_result=ctx.codesign_result,
+        spctl_result=ctx.spctl_result,
+        finding_id=ctx.id_base + _SUF_VERIFIED,
+        team_id=ctx.team_id,
+        vendor_name=ctx.vendor_name
+    )
+
+
+def _rule_app_high_risk_entitlements(ctx: _RuleContext) -> Finding | None:
+    """Rule 5: High-risk entitlements -> MED (or HIGH if unsigned/untrusted)."""
+    entitlements_result = ctx.entitlements_result
+    if not entitlements_result or entitlements_result.get("status") != "ok":
+        return None
+
+    high_risk_ents = entitlements_result.get("high_risk", [])
+    if not high_risk_ents:
+        return None
+
+    # Adjust risk based on signature and vendor trust
+    risk = Risk.HIGH
+    if ctx.is_signed and ctx.known_vendor:
+        risk = Risk.MED  # Known vendor with high-risk entitlements - still concerning but less critical
+    elif ctx.is_signed:
+        risk = Risk.MED  # At least it's signed
+
+    return _create_high_risk_entitlements_finding(
+        app=ctx.item,
+        entitlements_result=entitlements_result,
+        finding_id=ctx.id_base + _SUF_HIGH_RISK_ENTS,
+        risk=risk,
+        team_id=ctx.team_id
+    )
+
+
+def _rule_app_sensitive_entitlements(ctx: _RuleContext) -> Finding | None:
+    """Rule 6: Sensitive entitlements -> INFO (for awareness)."""
+    entitlements_result = ctx.entitlements_result
+    if not entitlements_result or entitlements_result.get("status") != "ok":
+        return None
+
+    sensitive_ents = entitlements_result.get("sensitive", [])
+    if not sensitive_ents:
+        return None
+
+    # Only report entitlements that aren't already covered by the
+    # high-risk finding above. Membership goes through a frozenset so
+    # long entitlement arrays stay O(sensitive + high_risk) instead of
+    # O(sensitive x high_risk)
+    high_risk_ents = entitlements_result.get("high_risk", [])
+    if high_risk_ents:
+        high_risk_set = frozenset(high_risk_ents)
+        non_high_risk_sensitive = [e for e in sensitive_ents if e not in high_risk_set]
+    else:
+        non_high_risk_sensitive = sensitive_ents
+
+    # Only report if app has 3+ non-high-risk sensitive entitlements
+    if len(non_high_risk_sensitive) < 3:
+        return None
+
+    return _create_sensitive_entitlements_finding(
+        app=ctx.item,
+        entitlements_result=entitlements_result,
+        finding_id=ctx.id_base + _SUF_SENSITIVE_ENTS,
+        team_id=ctx.team_id,
+        filtered_sensitive=non_high_risk_sensitive
+    )
+
+
+def _rule_launchd_codesign_fail(ctx: _RuleContext) -> Finding | None:
+    """Rule 1: Invalid code signature."""
+    if ctx.cs_status != _STATUS_FAIL:
+        return None
+
+    # Risk from the vendor table (known vendor -> MED)
+    risk = _CS_FAIL_RISK[ctx.known_vendor]
+
+    return _create_codesign_fail_finding(
+        codesign_result=ctx.codesign_result,
+        finding_id=ctx.id_base + _SUF_CS_FAIL,
+        name=ctx.name,
+        path=ctx.display_path,
+        category="persistence",
+        risk=risk,
+        team_id=ctx.team_id,
+        vendor_name=ctx.vendor_name
+    )
+
+
+def _rule_launchd_spctl_rejected(ctx: _RuleContext) -> Finding | None:
+    """Rule 2: Gatekeeper rejected."""
+    if ctx.sp_status != _STATUS_REJECTED:
+        return None
+
+    # Risk from the downgrade table: system helpers and other binaries from
+    # signed known vendors commonly fail spctl -> MED; everything else HIGH
+    risk = _SPCTL_RISK.get((ctx.is_signed, ctx.known_vendor, ctx.is_helper), Risk.HIGH)
+
+    return _create_spctl_rejected_finding(
+        spctl_result=ctx.spctl_result,
+        finding_id=ctx.id_base + _SUF_SPCTL,
+        name=ctx.name,
+        path=ctx.display_path,
+        category="persistence",
+        risk=risk,
+        team_id=ctx.team_id,
+        vendor_name=ctx.vendor_name,
+        is_helper=ctx.is_helper
+    )
+
+
+def _rule_launchd_user_writable(ctx: _RuleContext) -> Finding | None:
+    """Rule 3: Daemon with user-writable path -> HIGH."""
+    if ctx.scope != "daemon" or not is_user_writable_location(ctx.path):
+        return None
+
+    return _create_user_writable_daemon_finding(
+        finding_id=ctx.id_base + _SUF_USER_WRITABLE,
+        label=ctx.name,
+        program=ctx.path,
+        plist_path=ctx.display_path
+    )
+
+
+def _rule_launchd_quarantined(ctx: _RuleContext) -> Finding | None:
+    """Rule 4: Quarantined + RunAtLoad -> MED (LOW without auto-run)."""
+    if ctx.q_is != _QUARANTINED_TRUE:
+        return None
+
+    quarantine_value = ctx.quarantine_result.get("value", "")
+
+    # Skip quarantine finding for Homebrew items if configured
+    if ctx.config and ctx.config.trust_homebrew_cask and is_homebrew_quarantine(quarantine_value):
+        return None
+
+    if ctx.run_at_load:
+        return _create_quarantined_persistence_finding(
+            quarantine_result=ctx.quarantine_result,
+            finding_id=ctx.id_base + _SUF_QUARANTINED,
+            label=ctx.name,
+            program=ctx.path,
+            plist_path=ctx.display_path,
+            scope=ctx.scope,
+            run_at_load=True
+        )
+
+    # Quarantined but not auto-run -> LOW
+    return _create_quarantined_persistence_finding(
+        quarantine_result=ctx.quarantine_result,
+        finding_id=ctx.id_base + _SUF_QUARANTINED_ONLY,
+        label=ctx.name,
+        program=ctx.path,
+        plist_path=ctx.display_path,
+        scope=ctx.scope,
+        run_at_load=False
+    )
+
+
+# Precompiled rule tables: each entry is evaluated once per item against the
+# shared _RuleContext, returning a Finding or None
+_APP_RULES = (
+    _rule_app_codesign_fail,
+    _rule_app_spctl_rejected,
+    _rule_app_quarantined,
+    _rule_app_verified,
+    _rule_app_high_risk_entitlements,
+    _rule_app_sensitive_entitlements,
+)
+
+_LAUNCHD_RULES = (
+    _rule_launchd_codesign_fail,
+    _rule_launchd_spctl_rejected,
+    _rule_launchd_user_writable,
+    _rule_launchd_quarantined,
+)
+
 
 def analyze_app(
     app: dict,
@@ -40,138 +505,64 @@ def analyze_app(
     Returns:
         List of Finding objects for security issues detected
     """
-    findings = []
-    
+    # Early out: every app rule needs at least one collector result, so
+    # skip all the context setup (path, vendor, AppContext stat) when the
+    # collectors produced nothing for this app
+    if not (codesign_result or spctl_result or quarantine_result or entitlements_result):
+        return []
+
     # Generate base ID for this app
     app_id_base = app.get("bundle_id") or app.get("name", "unknown")
-    path = app.get("exec_path") or app.get("app_path", "")
-    
-    # Extract context for risk assessment
-    team_id = codesign_result.get("team_id", "") if codesign_result else ""
-    is_signed = codesign_result and codesign_result.get("status") == "ok"
+    path = _canonical_path(app)
+
+    # Extract context for risk assessment. Vendor name and helper-path
+    # predicates are resolved once here and threaded into the builders.
+    # Intern the team ID: the same handful of IDs recur across every app
+    # and helper, so interning makes later dict hits pointer comparisons
+    team_id = sys.intern(codesign_result.get("team_id", "")) if codesign_result else ""
+    cs_status = codesign_result.get("status") if codesign_result else None
+    sp_status = spctl_result.get("status") if spctl_result else None
+    q_is = quarantine_result.get("is_quarantined") if quarantine_result else None
+    is_signed = cs_status == _STATUS_OK
     known_vendor = is_known_vendor(team_id) if team_id else False
-    
+    vendor_name = get_vendor_name(team_id) if known_vendor else None
+    is_helper = is_system_helper_path(path)
+
     # Check if vendor is in config's trusted list
-    if config and team_id and team_id in config.trusted_vendors:
+    if config and team_id and team_id in config.trusted_vendor_set():
         known_vendor = True
-    
-    # Get enriched context
-    app_context = AppContext(path) if path else None
-    
-    # Rule 1: Invalid code signature
-    if codesign_result and codesign_result.get("status") == "fail":
-        # Adjust risk based on context
-        risk = Risk.HIGH
-        if known_vendor:
-            risk = Risk.MED  # Known vendor but invalid signature - concerning but less critical
-        
-        # Further adjust based on app context
-        if app_context:
-            # App Store apps with invalid signatures are still concerning (MED)
-            if app_context.is_app_store:
-                risk = Risk.MED
-            # Old apps that have been stable might have expired certs
-            elif config and config.trust_old_apps and app_context.age_days >= config.old_app_days:
-                risk = Risk.LOW
-        
-        finding = _create_codesign_fail_finding(
-            app=app,
-            codesign_result=codesign_result,
-            finding_id=f"app:{app_id_base}:codesign_fail",
-            risk=risk,
-            team_id=team_id
-        )
-        findings.append(finding)
-    
-    # Rule 2: Gatekeeper rejected
-    if spctl_result and spctl_result.get("status") == "rejected":
-        # Context-aware risk assessment
-        risk = Risk.HIGH
-        
-        # Downgrade if signed by known vendor (common for helpers/utilities)
-        if is_signed and known_vendor:
-            risk = Risk.MED
-        
-        # App Store apps shouldn't be rejected, but if they are, still MED
-        if app_context and app_context.is_app_store:
-            risk = Risk.MED
-        
-        finding = _create_spctl_rejected_finding(
-            app=app,
-            spctl_result=spctl_result,
-            finding_id=f"app:{app_id_base}:spctl_rejected",
-            risk=risk,
-            team_id=team_id
-        )
-        findings.append(finding)
-    
-    # Rule 3: Quarantined but not auto-run -> LOW (context-aware)
-    if quarantine_result and quarantine_result.get("is_quarantined") == "true":
-        risk = Risk.LOW
-        quarantine_value = quarantine_result.get("value", "")
-        
-        # Check quarantine source
-        if config and config.trust_homebrew_cask and is_homebrew_quarantine(quarantine_value):
-            # Skip quarantine findings for Homebrew Cask if configured
-            pass
-        else:
-            finding = _create_quarantined_app_finding(
-                app=app,
-                quarantine_result=quarantine_result,
-                finding_id=f"app:{app_id_base}:quarantined",
-                quarantine_source=parse_quarantine_source(quarantine_value)
-            )
-            findings.append(finding)
-    
-    # Rule 4: Fully verified by known vendor -> INFO
-    if is_signed and known_vendor and codesign_result and spctl_result and spctl_result.get("status") == "accepted":
-        finding = _create_verified_app_finding(
-            app=app,
-            codesign_result=codesign_result,
-            spctl_result=spctl_result,
-            finding_id=f"app:{app_id_base}:verified",
-            team_id=team_id
-        )
-        findings.append(finding)
-    
-    # Rule 5: High-risk entitlements -> MED (or HIGH if unsigned/untrusted)
-    if entitlements_result and entitlements_result.get("status") == "ok":
-        high_risk_ents = entitlements_result.get("high_risk", [])
-        if high_risk_ents:
-            # Adjust risk based on signature and vendor trust
-            risk = Risk.HIGH
-            if is_signed and known_vendor:
-                risk = Risk.MED  # Known vendor with high-risk entitlements - still concerning but less critical
-            elif is_signed:
-                risk = Risk.MED  # At least it's signed
-            
-            finding = _create_high_risk_entitlements_finding(
-                app=app,
-                entitlements_result=entitlements_result,
-                finding_id=f"app:{app_id_base}:high_risk_entitlements",
-                risk=risk,
-                team_id=team_id
-            )
-            findings.append(finding)
-    
-    # Rule 6: Sensitive entitlements -> INFO (for awareness)
-    if entitlements_result and entitlements_result.get("status") == "ok":
-        sensitive_ents = entitlements_result.get("sensitive", [])
-        # Only report if there are sensitive entitlements and they're not all high-risk
-        # (high-risk already reported above)
-        high_risk_ents = entitlements_result.get("high_risk", [])
-        non_high_risk_sensitive = [e for e in sensitive_ents if e not in high_risk_ents]
-        
-        if non_high_risk_sensitive and len(non_high_risk_sensitive) >= 3:
-            # Only report if app has 3+ non-high-risk sensitive entitlements
-            finding = _create_sensitive_entitlements_finding(
-                app=app,
-                entitlements_result=entitlements_result,
-                finding_id=f"app:{app_id_base}:sensitive_entitlements",
-                team_id=team_id
-            )
+
+    # Bind everything once, then run the precompiled rule table in a single
+    # dispatch pass over the shared context. AppContext is NOT built here:
+    # only the codesign-fail and spctl-rejected rules read it, so they
+    # fetch it lazily from the cache and verified apps skip the stat
+    ctx = _RuleContext(
+        item=app,
+        codesign_result=codesign_result,
+        spctl_result=spctl_result,
+        quarantine_result=quarantine_result,
+        entitlements_result=entitlements_result,
+        config=config,
+        id_base=f"app:{app_id_base}",
+        path=path,
+        name=app.get("name") or app.get("label", "Unknown"),
+        display_path=path,
+        team_id=team_id,
+        cs_status=cs_status,
+        sp_status=sp_status,
+        q_is=q_is,
+        is_signed=is_signed,
+        known_vendor=known_vendor,
+        vendor_name=vendor_name,
+        is_helper=is_helper
+    )
+
+    findings = []
+    for rule in _APP_RULES:
+        finding = rule(ctx)
+        if finding is not None:
             findings.append(finding)
-    
+
     return findings
 
 
@@ -195,280 +586,252 @@ def analyze_launchd(
     Returns:
         List of Finding objects for security issues detected
     """
-    findings = []
-    
     # Generate base ID for this persistence item
     scope = launchd_item.get("scope", "unknown")
     label = launchd_item.get("label", "unknown")
-    persistence_id_base = f"persistence:{scope}:{label}"
     program = launchd_item.get("program", "")
-    plist_path = launchd_item.get("plist_path", "")
-    
-    # Extract context for risk assessment
-    team_id = codesign_result.get("team_id", "") if codesign_result else ""
-    is_signed = codesign_result and codesign_result.get("status") == "ok"
+
+    # Extract context for risk assessment. Vendor name and helper-path
+    # predicates are resolved once here and threaded into the builders.
+    # Intern the team ID: the same handful of IDs recur across every app
+    # and helper, so interning makes later dict hits pointer comparisons
+    team_id = sys.intern(codesign_result.get("team_id", "")) if codesign_result else ""
+    cs_status = codesign_result.get("status") if codesign_result else None
+    sp_status = spctl_result.get("status") if spctl_result else None
+    q_is = quarantine_result.get("is_quarantined") if quarantine_result else None
+    is_signed = cs_status == _STATUS_OK
     known_vendor = is_known_vendor(team_id) if team_id else False
+    vendor_name = get_vendor_name(team_id) if known_vendor else None
+    # Classify helpers from the program path, not the plist path: the
+    # binary is what lives under PrivilegedHelperTools/XPCServices, so
+    # vendor daemons get the helper-specific recommendation. (Classifying
+    # from the plist path could never match and made that recommendation
+    # unreachable for launchd items.)
     is_helper = is_system_helper_path(program)
-    
+
     # Check if vendor is in config's trusted list
-    if config and team_id and team_id in config.trusted_vendors:
+    if config and team_id and team_id in config.trusted_vendor_set():
         known_vendor = True
-    
-    # Rule 1: Invalid code signature
-    if codesign_result and codesign_result.get("status") == "fail":
-        # Context-aware risk
-        risk = Risk.HIGH
-        if known_vendor:
-            risk = Risk.MED
-        
-        finding = _create_codesign_fail_finding(
-            app=launchd_item,
-            codesign_result=codesign_result,
-            finding_id=f"{persistence_id_base}:codesign_fail",
-            category="persistence",
-            risk=risk,
-            team_id=team_id
-        )
-        findings.append(finding)
-    
-    # Rule 2: Gatekeeper rejected
-    if spctl_result and spctl_result.get("status") == "rejected":
-        # Context-aware risk assessment
-        risk = Risk.HIGH
-        
-        # System helpers from known vendors commonly fail spctl -> MED
-        if is_signed and known_vendor and is_helper:
-            risk = Risk.MED
-        # Signed by known vendor but not a helper -> still MED (better than unknown)
-        elif is_signed and known_vendor:
-            risk = Risk.MED
-        
-        finding = _create_spctl_rejected_finding(
-            app=launchd_item,
-            spctl_result=spctl_result,
-            finding_id=f"{persistence_id_base}:spctl_rejected",
-            category="persistence",
-            risk=risk,
-            team_id=team_id
-        )
-        findings.append(finding)
-    
-    # Rule 3: Daemon with user-writable path -> HIGH
-    if scope == "daemon" and is_user_writable_location(program):
-        finding = _create_user_writable_daemon_finding(
-            launchd_item=launchd_item,
-            finding_id=f"{persistence_id_base}:user_writable"
-        )
-        findings.append(finding)
-    
-    # Rule 4: Quarantined + RunAtLoad -> MED
-    run_at_load = launchd_item.get("run_at_load", False)
-    
-    if quarantine_result and quarantine_result.get("is_quarantined") == "true":
-        quarantine_value = quarantine_result.get("value", "")
-        
-        # Check if Homebrew source and config trusts it
-        if config and config.trust_homebrew_cask and is_homebrew_quarantine(quarantine_value):
-            # Skip quarantine finding for Homebrew items if configured
-            pass
-        else:
-            if run_at_load:
-                finding = _create_quarantined_persistence_finding(
-                    launchd_item=launchd_item,
-                    quarantine_result=quarantine_result,
-                    finding_id=f"{persistence_id_base}:quarantined",
-                    run_at_load=True
-                )
-                findings.append(finding)
-            else:
-                # Quarantined but not auto-run -> LOW
-                finding = _create_quarantined_persistence_finding(
-                    launchd_item=launchd_item,
-                    quarantine_result=quarantine_result,
-                    finding_id=f"{persistence_id_base}:quarantined_only",
-                    run_at_load=False
-                )
-                findings.append(finding)
-    
+
+    # Bind everything once, then run the precompiled rule table in a single
+    # dispatch pass over the shared context
+    ctx = _RuleContext(
+        item=launchd_item,
+        codesign_result=codesign_result,
+        spctl_result=spctl_result,
+        quarantine_result=quarantine_result,
+        entitlements_result=None,
+        config=config,
+        id_base=f"persistence:{scope}:{label}",
+        path=program,
+        name=launchd_item.get("name") or launchd_item.get("label", "Unknown"),
+        display_path=launchd_item.get("plist_path", ""),
+        team_id=team_id,
+        cs_status=cs_status,
+        sp_status=sp_status,
+        q_is=q_is,
+        is_signed=is_signed,
+        known_vendor=known_vendor,
+        vendor_name=vendor_name,
+        is_helper=is_helper,
+        scope=scope,
+        run_at_load=launchd_item.get("run_at_load", False)
+    )
+
+    findings = []
+    for rule in _LAUNCHD_RULES:
+        finding = rule(ctx)
+        if finding is not None:
+            findings.append(finding)
+
+    return findings
+
+
+def analyze_apps_batch(
+    apps: list[dict],
+    codesign_results: list[dict | None],
+    spctl_results: list[dict | None],
+    quarantine_results: list[dict | None],
+    entitlements_results: list[dict | None] | None = None,
+    config: Config | None = None
+) -> list[Finding]:
+    """
+    Analyze a batch of applications in one pass.
+
+    Columnar driver over analyze_app for callers that already hold the
+    collector results for every app: binds the analyzer once, iterates all
+    apps in a single tight loop, and flattens the findings. Avoids the
+    per-call global lookups and list plumbing of invoking analyze_app from
+    an outer Python loop.
+
+    Args:
+        apps: Application records, parallel to the result lists
+        codesign_results: codesign_verify() result per app (or None)
+        spctl_results: spctl_assess() result per app (or None)
+        quarantine_results: get_quarantine() result per app (or None)
+        entitlements_results: get_entitlements() result per app (or None)
+        config: Configuration for trust and risk adjustments
+
+    Returns:
+        Flattened list of Finding objects across all apps
+    """
+    if entitlements_results is None:
+        entitlements_results = [None] * len(apps)
+
+    analyze = analyze_app
+    findings: list[Finding] = []
+    extend = findings.extend
+    for app, cs, sp, quar, ents in zip(
+        apps, codesign_results, spctl_results, quarantine_results, entitlements_results
+    ):
+        try:
+            extend(analyze(app, cs, sp, quar, ents, config))
+        except Exception:
+            # Analysis failed for this app, but one bad app doesn't stop
+            # the entire scan
+            continue
+
     return findings
 
 
 def _create_codesign_fail_finding(
-    app: dict,
     codesign_result: dict,
     finding_id: str,
+    name: str,
+    path: str,
     category: str = "app",
     risk: Risk = Risk.HIGH,
-    team_id: str = ""
+    team_id: str = "",
+    vendor_name: str | None = None
 ) -> Finding:
     """Create a finding for failed code signature verification."""
-    path = app.get("exec_path") or app.get("app_path") or app.get("plist_path", "")
-    name = app.get("name") or app.get("label", "Unknown")
-    
-    # Build vendor-aware recommendation
-    recommendation = "Verify the source of this item. Remove if untrusted. Re-download from official sources if legitimate."
-    if team_id and is_known_vendor(team_id):
-        vendor_name = get_vendor_name(team_id)
-        recommendation = (
-            f"This item is signed by {vendor_name} (Team ID: {team_id}), but the signature is invalid. "
-            f"This could indicate corruption or tampering. Reinstall from official {vendor_name} sources."
-        )
-    
+    # Build exactly one recommendation (vendor_name is pre-resolved by the
+    # analyzer; None means the Team ID is not in the known-vendor table)
+    if vendor_name:
+        recommendation = _rec_cs_fail_known(vendor_name, team_id)
+    else:
+        recommendation = _REC_CS_FAIL_DEFAULT
+
+    # Positional construction: Finding is a slots dataclass with a locked
+    # field order (id, category, risk, title, details, recommendation,
+    # path, evidence), and positional calls skip keyword-dispatch overhead
+    # in the hottest builders
     return Finding(
-        id=finding_id,
-        category=category,
-        risk=risk,
-        title=f"Invalid code signature: {name}",
-        details=(
-            f"Code signature verification failed for {name}. "
-            "This could indicate tampering, corruption, or an unsigned binary."
-        ),
-        path=path,
-        evidence={
+        finding_id,
+        category,
+        risk,
+        f"Invalid code signature: {name}",
+        _DETAILS_CS_FAIL_PREFIX + name + _DETAILS_CS_FAIL_SUFFIX,
+        recommendation,
+        path,
+        {
             "codesign_status": codesign_result.get("status", ""),
             "codesign_team_id": team_id,
-            "codesign_raw": codesign_result.get("raw", "")[:200],
-        },
-        recommendation=recommendation
+            # raw is already bounded to ~200 chars by the collector
+            "codesign_raw": codesign_result.get("raw", ""),
+        }
     )
 
 
 def _create_spctl_rejected_finding(
-    app: dict,
     spctl_result: dict,
     finding_id: str,
+    name: str,
+    path: str,
     category: str = "app",
     risk: Risk = Risk.HIGH,
-    team_id: str = ""
+    team_id: str = "",
+    vendor_name: str | None = None,
+    is_helper: bool = False
 ) -> Finding:
     """Create a finding for Gatekeeper rejection."""
-    path = app.get("exec_path") or app.get("app_path") or app.get("plist_path", "")
-    name = app.get("name") or app.get("label", "Unknown")
-    
-    # Build vendor-aware recommendation
-    recommendation = (
-        "Do not run this item unless you explicitly trust the source. "
-        "Verify authenticity and consider obtaining from App Store or notarized sources."
-    )
-    
-    if team_id and is_known_vendor(team_id):
-        vendor_name = get_vendor_name(team_id)
-        is_helper = is_system_helper_path(path)
-        
+    # Build exactly one recommendation (vendor_name and is_helper are
+    # pre-resolved by the analyzer)
+    if vendor_name:
         if is_helper:
-            recommendation = (
-                f"This is a {vendor_name} system helper (Team ID: {team_id}). "
-                f"Helper utilities commonly fail Gatekeeper checks but may be safe if part of a verified {vendor_name} installation. "
-                f"Verify the main {vendor_name} application is properly installed and up to date."
-            )
+            recommendation = _rec_spctl_helper(vendor_name, team_id)
         else:
-            recommendation = (
-                f"This item is signed by {vendor_name} (Team ID: {team_id}) but rejected by Gatekeeper. "
-                f"This may be a helper utility or older version. Verify with official {vendor_name} documentation."
-            )
-    
+            recommendation = _rec_spctl_known(vendor_name, team_id)
+    else:
+        recommendation = _REC_SPCTL_DEFAULT
+
     return Finding(
-        id=finding_id,
-        category=category,
-        risk=risk,
-        title=f"Gatekeeper blocked: {name}",
-        details=(
-            f"macOS Gatekeeper has rejected {name}. "
-            "This item does not meet Apple's security requirements for execution."
-        ),
-        path=path,
-        evidence={
+        finding_id,
+        category,
+        risk,
+        f"Gatekeeper blocked: {name}",
+        _DETAILS_SPCTL_PREFIX + name + _DETAILS_SPCTL_SUFFIX,
+        recommendation,
+        path,
+        {
             "spctl_status": spctl_result.get("status", ""),
             "spctl_source": spctl_result.get("source", ""),
             "spctl_team_id": team_id,
-            "spctl_raw": spctl_result.get("raw", "")[:200],
-        },
-        recommendation=recommendation
+            # raw is already bounded to ~150 chars by the collector
+            "spctl_raw": spctl_result.get("raw", ""),
+        }
     )
 
 
 def _create_user_writable_daemon_finding(
-    launchd_item: dict,
-    finding_id: str
+    finding_id: str,
+    label: str,
+    program: str,
+    plist_path: str
 ) -> Finding:
     """Create a finding for system daemon with user-writable program path."""
-    program = launchd_item.get("program", "")
-    label = launchd_item.get("label", "Unknown")
-    plist_path = launchd_item.get("plist_path", "")
-    
     return Finding(
-        id=finding_id,
-        category="persistence",
-        risk=Risk.HIGH,
-        title=f"System daemon uses user-writable path: {label}",
-        details=(
-            f"System daemon '{label}' executes a program from a user-writable location ({program}). "
-            "This is a privilege escalation risk, as the daemon runs with elevated privileges "
-            "but its binary could be modified by unprivileged users."
-        ),
-        path=plist_path,
-        evidence={
+        finding_id,
+        "persistence",
+        Risk.HIGH,
+        f"System daemon uses user-writable path: {label}",
+        _DETAILS_USER_WRITABLE.format(label=label, program=program),
+        _REC_USER_WRITABLE,
+        plist_path,
+        {
             "scope": "daemon",
             "program": program,
             "label": label,
-        },
-        recommendation=(
-            "Move the program to a system-protected location (e.g., /usr/local/bin) with appropriate "
-            "permissions, or remove this launch daemon if it's not needed."
-        )
+        }
     )
 
 
 def _create_quarantined_persistence_finding(
-    launchd_item: dict,
     quarantine_result: dict,
     finding_id: str,
+    label: str,
+    program: str,
+    plist_path: str,
+    scope: str,
     run_at_load: bool = True
 ) -> Finding:
     """Create a finding for quarantined persistence item."""
-    label = launchd_item.get("label", "Unknown")
-    program = launchd_item.get("program", "")
-    plist_path = launchd_item.get("plist_path", "")
-    scope = launchd_item.get("scope", "unknown")
-    
     if run_at_load:
         risk = Risk.MED
         title = f"Quarantined persistence item (auto-run): {label}"
-        details = (
-            f"Launch {scope} '{label}' has the quarantine attribute set and is configured to run at load. "
-            "Quarantined items are typically downloads that haven't been explicitly approved by the user."
-        )
-        recommendation = (
-            "Review this persistence item. If legitimate, remove the quarantine attribute. "
-            "If untrusted, remove the launch agent/daemon entirely."
-        )
+        details = _DETAILS_QUAR_PERSIST_AUTORUN.format(scope=scope, label=label)
+        recommendation = _REC_QUAR_PERSIST_AUTORUN
     else:
         risk = Risk.LOW
         title = f"Quarantined persistence item: {label}"
-        details = (
-            f"Launch {scope} '{label}' has the quarantine attribute set but is not configured for auto-start. "
-            "This is typically from a downloaded item that hasn't been user-approved yet."
-        )
-        recommendation = (
-            "Review this item. Quarantine attributes on persistence items without RunAtLoad are lower risk "
-            "since they don't auto-execute. Remove the quarantine if legitimate or delete if unwanted."
-        )
+        details = _DETAILS_QUAR_PERSIST.format(scope=scope, label=label)
+        recommendation = _REC_QUAR_PERSIST_NORUN
     
     return Finding(
-        id=finding_id,
-        category="persistence",
-        risk=risk,
-        title=title,
-        details=details,
-        path=plist_path,
-        evidence={
+        finding_id,
+        "persistence",
+        risk,
+        title,
+        details,
+        recommendation,
+        plist_path,
+        {
             "scope": scope,
             "program": program,
             "label": label,
-            "quarantine_value": quarantine_result.get("value", "")[:100],
+            "quarantine_value": _cap(quarantine_result.get("value", ""), 100),
             "run_at_load": str(run_at_load).lower(),
-        },
-        recommendation=recommendation
+        }
     )
 
 
@@ -480,13 +843,10 @@ def _create_quarantined_app_finding(
 ) -> Finding:
     """Create a finding for quarantined application."""
     name = app.get("name", "Unknown")
-    path = app.get("exec_path") or app.get("app_path", "")
-    
+    path = _canonical_path(app)
+
     # Enhance recommendation with source info
-    recommendation = (
-        "Review this application. If it's legitimate software you downloaded, "
-        "you can remove the quarantine attribute by running it or using: xattr -d com.apple.quarantine"
-    )
+    recommendation = _REC_QUAR_APP
     
     if quarantine_source:
         recommendation = (
@@ -496,24 +856,24 @@ def _create_quarantined_app_finding(
         )
     
     evidence = {
-        "quarantine_value": quarantine_result.get("value", "")[:100],
+        "quarantine_value": _cap(quarantine_result.get("value", ""), 100),
     }
     
     if quarantine_source:
         evidence["quarantine_source"] = quarantine_source
     
     return Finding(
-        id=finding_id,
-        category="app",
-        risk=Risk.LOW,
-        title=f"Quarantined application: {name}",
-        details=(
+        finding_id,
+        "app",
+        Risk.LOW,
+        f"Quarantined application: {name}",
+        (
             f"Application '{name}' has the quarantine attribute set. This typically indicates "
             "it was downloaded and hasn't been explicitly approved for execution yet."
         ),
-        path=path,
-        evidence=evidence,
-        recommendation=recommendation
+        recommendation,
+        path,
+        evidence
     )
 
 
@@ -522,32 +882,29 @@ def _create_verified_app_finding(
     codesign_result: dict,
     spctl_result: dict,
     finding_id: str,
-    team_id: str
+    team_id: str,
+    vendor_name: str | None = None
 ) -> Finding:
     """Create an informational finding for fully verified application."""
     name = app.get("name", "Unknown")
-    path = app.get("exec_path") or app.get("app_path", "")
-    vendor_name = get_vendor_name(team_id) if team_id else "Unknown"
+    path = _canonical_path(app)
+    # vendor_name is None for config-trusted Team IDs not in the vendor table
+    vendor_name = vendor_name or team_id or "Unknown"
     
     return Finding(
-        id=finding_id,
-        category="app",
-        risk=Risk.INFO,
-        title=f"Verified application: {name}",
-        details=(
-            f"Application '{name}' is properly signed by {vendor_name} and passes all "
-            "macOS security requirements including Gatekeeper."
-        ),
-        path=path,
-        evidence={
+        finding_id,
+        "app",
+        Risk.INFO,
+        f"Verified application: {name}",
+        _DETAILS_VERIFIED.format(name=name, vendor=vendor_name),
+        "This application is fully verified and trusted. No action needed.",
+        path,
+        {
             "codesign_status": "ok",
             "spctl_status": "accepted",
             "team_id": team_id,
             "vendor": vendor_name,
-        },
-        recommendation=(
-            "This application is fully verified and trusted. No action needed."
-        )
+        }
     )
 
 
@@ -583,7 +940,7 @@ def analyze_kext(kext: dict, config: Config | None = None) -> list[Finding]:
     # Check if vendor is trusted via config
     config_trusted_vendor = False
     if config and team_id:
-        config_trusted_vendor = team_id in config.trusted_vendors
+        config_trusted_vendor = team_id in config.trusted_vendor_set()
     
     # Base finding ID
     finding_id_base = f"kext:{bundle_id}"
@@ -753,8 +1110,8 @@ def _create_high_risk_entitlements_finding(
         "Remove if the application is untrusted or no longer needed."
     )
     
-    if team_id and is_known_vendor(team_id):
-        vendor_name = get_vendor_name(team_id)
+    vendor_name = lookup_vendor(team_id) if team_id else None
+    if vendor_name:
         recommendation = (
             f"This application is from {vendor_name} (Team ID: {team_id}) and has high-risk entitlements. "
             "While known vendors may legitimately need these permissions, verify the application is up to date "
@@ -787,18 +1144,23 @@ def _create_sensitive_entitlements_finding(
     app: dict,
     entitlements_result: dict,
     finding_id: str,
-    team_id: str = ""
+    team_id: str = "",
+    filtered_sensitive: list[str] | None = None
 ) -> Finding:
     """Create an INFO finding for sensitive entitlements (awareness)."""
     path = app.get("exec_path") or app.get("app_path", "")
     name = app.get("name", "Unknown")
-    sensitive_ents = entitlements_result.get("sensitive", [])
-    high_risk_ents = entitlements_result.get("high_risk", [])
-    
-    # Filter out high-risk from sensitive list (already reported)
-    non_high_risk_sensitive = [e for e in sensitive_ents if e not in high_risk_ents]
-    
-    sensitive_list = ", ".join(non_high_risk_sensitive)
+
+    # The rule already filtered high-risk entitlements out of the
+    # sensitive list; reuse that list rather than recomputing the filter
+    if filtered_sensitive is None:
+        high_risk_set = frozenset(entitlements_result.get("high_risk", []))
+        filtered_sensitive = [
+            e for e in entitlements_result.get("sensitive", [])
+            if e not in high_risk_set
+        ]
+
+    sensitive_list = ", ".join(filtered_sensitive)
     
     # Build vendor-aware recommendation
     recommendation = (
@@ -806,8 +1168,8 @@ def _create_sensitive_entitlements_finding(
         "Ensure the application is from a trusted source and you understand why it needs these capabilities."
     )
     
-    if team_id and is_known_vendor(team_id):
-        vendor_name = get_vendor_name(team_id)
+    vendor_name = lookup_vendor(team_id) if team_id else None
+    if vendor_name:
         recommendation = (
             f"This application from {vendor_name} (Team ID: {team_id}) has sensitive permissions. "
             "This is informational - many legitimate applications need camera, microphone, or contact access. "
@@ -864,13 +1226,37 @@ def _create_legacy_kext_finding(
             "type": "kext",
             "loaded": True,
         },
-        recommendation=(
-            "Check if the vendor provides a System Extension version. "
-            "Legacy KEXTs are deprecated and may not be supported in future macOS releases."
-        )
+        recommendation=_REC_LEGACY_KEXT
     )
 
 
+# Invariant kext/extension recommendations, hoisted like the app and
+# persistence recommendation constants above
+_REC_LEGACY_KEXT = (
+    "Check if the vendor provides a System Extension version. "
+    "Legacy KEXTs are deprecated and may not be supported in future macOS releases."
+)
+_REC_EXT_HIGH_RISK = (
+    "Review whether this extension is necessary and from a trusted source. "
+    "Extensions with these permissions can intercept and modify all web traffic, "
+    "inject code into pages, or weaken security settings. "
+    "Remove if untrusted or no longer needed."
+)
+_REC_EXT_BROAD_ACCESS = (
+    "Verify this extension is from a trusted source and review its privacy policy. "
+    "Extensions with broad host access can read passwords, credit card info, and "
+    "personal data from any website you visit."
+)
+_REC_EXT_SUSPICIOUS = (
+    "Review whether this extension needs all these permissions. "
+    "Consider alternatives with fewer permissions or remove if not essential."
+)
+_REC_EXT_INFO = (
+    "Periodically review installed browser extensions and remove those no longer needed. "
+    "Only install extensions from trusted sources."
+)
+
+
 # Suspicious browser extension permissions
 SUSPICIOUS_PERMISSIONS = {
     "tabs": "Access browser tabs",
@@ -921,13 +1307,19 @@ def analyze_browser_extension(
     browser = extension.get("browser", "unknown")
     ext_id = extension.get("id", "unknown")
     ext_id_base = f"browser_ext:{browser}:{ext_id}"
-    
+
     permissions = extension.get("permissions", [])
     host_permissions = extension.get("host_permissions", [])
+
+    # Shared display fields: resolved once here instead of per builder.
+    # The browser vocabulary is tiny, so the case transforms are memoized
+    # and every extension from the same browser shares the same strings
+    name = extension.get("name", "Unknown")
+    browser_name, browser_lower = _browser_display(browser)
+    path = extension.get("manifest_path", "")
     
-    # Identify suspicious permissions
-    suspicious_perms = _identify_suspicious_extension_permissions(permissions)
-    high_risk_perms = _identify_high_risk_extension_permissions(permissions)
+    # Identify suspicious and high-risk permissions in one pass
+    suspicious_perms, high_risk_perms = _classify_extension_permissions(permissions)
     
     # Rule 1: High-risk permissions -> HIGH
     if high_risk_perms:
@@ -935,7 +1327,11 @@ def analyze_browser_extension(
             extension=extension,
             finding_id=f"{ext_id_base}:high_risk_permissions",
             high_risk_perms=high_risk_perms,
-            all_perms=permissions
+            all_perms=permissions,
+            name=name,
+            browser_name=browser_name,
+            browser_lower=browser_lower,
+            path=path
         )
         findings.append(finding)
     
@@ -944,7 +1340,11 @@ def analyze_browser_extension(
         finding = _create_broad_access_extension_finding(
             extension=extension,
             finding_id=f"{ext_id_base}:broad_access",
-            host_permissions=host_permissions
+            host_permissions=host_permissions,
+            name=name,
+            browser_name=browser_name,
+            browser_lower=browser_lower,
+            path=path
         )
         findings.append(finding)
     
@@ -953,7 +1353,11 @@ def analyze_browser_extension(
         finding = _create_suspicious_extension_finding(
             extension=extension,
             finding_id=f"{ext_id_base}:suspicious_permissions",
-            suspicious_perms=suspicious_perms
+            suspicious_perms=suspicious_perms,
+            name=name,
+            browser_name=browser_name,
+            browser_lower=browser_lower,
+            path=path
         )
         findings.append(finding)
     
@@ -963,104 +1367,99 @@ def analyze_browser_extension(
             extension=extension,
             finding_id=f"{ext_id_base}:info",
             permissions=permissions,
-            host_permissions=host_permissions
+            host_permissions=host_permissions,
+            name=name,
+            browser_name=browser_name,
+            browser_lower=browser_lower,
+            path=path
         )
         findings.append(finding)
     
     return findings
 
 
-def _identify_suspicious_extension_permissions(permissions: List[str]) -> List[str]:
-    """Identify suspicious permissions from extension's permission list."""
-    suspicious = []
-    for perm in permissions:
-        if perm in SUSPICIOUS_PERMISSIONS:
-            suspicious.append(SUSPICIOUS_PERMISSIONS[perm])
-    return suspicious
-
+def _classify_extension_permissions(permissions: List[str]) -> tuple[List[str], List[str]]:
+    """
+    Classify extension permissions into (suspicious, high_risk) descriptions.
 
-def _identify_high_risk_extension_permissions(permissions: List[str]) -> List[str]:
-    """Identify high-risk permissions from extension's permission list."""
+    A single walk over the permission list feeds both rules; the previous
+    two helpers each re-scanned the full list. Order follows the manifest.
+    """
+    suspicious = []
     high_risk = []
     for perm in permissions:
+        description = SUSPICIOUS_PERMISSIONS.get(perm)
+        if description is not None:
+            suspicious.append(description)
         if perm in HIGH_RISK_PERMISSIONS:
-            if perm in SUSPICIOUS_PERMISSIONS:
-                high_risk.append(SUSPICIOUS_PERMISSIONS[perm])
-            else:
-                high_risk.append(perm)
-    return high_risk
+            high_risk.append(description if description is not None else perm)
+    return suspicious, high_risk
+
+
+@lru_cache(maxsize=16)
+def _browser_display(browser: str) -> tuple[str, str]:
+    """Memoized (capitalized, lowercased) forms of a browser name."""
+    return browser.capitalize(), browser.lower()
 
 
 def _has_broad_host_access(host_permissions: List[str]) -> bool:
     """Check if extension has overly broad host access."""
-    broad_patterns = [
-        "<all_urls>",
-        "*://*/*",
-        "http://*/*",
-        "https://*/*",
-    ]
-    
-    for host in host_permissions:
-        if host in broad_patterns:
-            return True
-        # Check for wildcards in domain
-        if host.count("*") >= 2:  # Multiple wildcards like *://*.example.com/*
-            return True
-    
-    return False
+    # Every broad URL pattern (*://*/*, http(s)://*/*, multi-wildcard
+    # domains like *://*.example.com/*) carries at least two '*', so one
+    # C-level count covers them all; "<all_urls>" is the lone star-free
+    # grant that still means every site
+    return any(
+        host.count("*") >= 2 or host == "<all_urls>"
+        for host in host_permissions
+    )
 
 
 def _create_high_risk_extension_finding(
     extension: dict,
     finding_id: str,
     high_risk_perms: List[str],
-    all_perms: List[str]
+    all_perms: List[str],
+    name: str = "Unknown",
+    browser_name: str = "Unknown",
+    browser_lower: str = "unknown",
+    path: str = ""
 ) -> Finding:
     """Create a finding for high-risk browser extension permissions."""
-    name = extension.get("name", "Unknown")
-    browser = extension.get("browser", "unknown").capitalize()
-    path = extension.get("manifest_path", "")
-    
     perms_list = ", ".join(high_risk_perms)
     
     return Finding(
         id=finding_id,
         category="browser_extension",
         risk=Risk.HIGH,
-        title=f"High-risk {browser} extension: {name}",
+        title=f"High-risk {browser_name} extension: {name}",
         details=(
-            f"{browser} extension '{name}' has high-risk permissions: {perms_list}. "
+            f"{browser_name} extension '{name}' has high-risk permissions: {perms_list}. "
             "These permissions can be exploited to intercept web traffic, inject malicious code, "
             "or compromise your browsing security."
         ),
         path=path,
         evidence={
-            "browser": browser.lower(),
+            "browser": browser_lower,
             "extension_name": name,
             "high_risk_permissions": perms_list,
             "all_permissions": ", ".join(all_perms),
             "extension_id": extension.get("id", ""),
         },
-        recommendation=(
-            "Review whether this extension is necessary and from a trusted source. "
-            "Extensions with these permissions can intercept and modify all web traffic, "
-            "inject code into pages, or weaken security settings. "
-            "Remove if untrusted or no longer needed."
-        )
+        recommendation=_REC_EXT_HIGH_RISK
     )
 
 
 def _create_broad_access_extension_finding(
     extension: dict,
     finding_id: str,
-    host_permissions: List[str]
+    host_permissions: List[str],
+    name: str = "Unknown",
+    browser_name: str = "Unknown",
+    browser_lower: str = "unknown",
+    path: str = ""
 ) -> Finding:
     """Create a finding for browser extension with broad host access."""
-    name = extension.get("name", "Unknown")
-    browser = extension.get("browser", "unknown").capitalize()
-    path = extension.get("manifest_path", "")
-    
-    hosts_list = ", ".join(host_permissions[:5])  # First 5 hosts
+    hosts_list = ", ".join(islice(host_permissions, 5))  # First 5 hosts
     if len(host_permissions) > 5:
         hosts_list += f", ... ({len(host_permissions)} total)"
     
@@ -1068,58 +1467,51 @@ def _create_broad_access_extension_finding(
         id=finding_id,
         category="browser_extension",
         risk=Risk.MED,
-        title=f"Broad access {browser} extension: {name}",
+        title=f"Broad access {browser_name} extension: {name}",
         details=(
-            f"{browser} extension '{name}' has access to all websites or very broad URL patterns. "
+            f"{browser_name} extension '{name}' has access to all websites or very broad URL patterns. "
             "This extension can read and modify content on any page you visit."
         ),
         path=path,
         evidence={
-            "browser": browser.lower(),
+            "browser": browser_lower,
             "extension_name": name,
             "host_permissions": hosts_list,
             "extension_id": extension.get("id", ""),
         },
-        recommendation=(
-            "Verify this extension is from a trusted source and review its privacy policy. "
-            "Extensions with broad host access can read passwords, credit card info, and "
-            "personal data from any website you visit."
-        )
+        recommendation=_REC_EXT_BROAD_ACCESS
     )
 
 
 def _create_suspicious_extension_finding(
     extension: dict,
     finding_id: str,
-    suspicious_perms: List[str]
+    suspicious_perms: List[str],
+    name: str = "Unknown",
+    browser_name: str = "Unknown",
+    browser_lower: str = "unknown",
+    path: str = ""
 ) -> Finding:
     """Create a finding for browser extension with multiple suspicious permissions."""
-    name = extension.get("name", "Unknown")
-    browser = extension.get("browser", "unknown").capitalize()
-    path = extension.get("manifest_path", "")
-    
     perms_list = ", ".join(suspicious_perms)
     
     return Finding(
         id=finding_id,
         category="browser_extension",
         risk=Risk.MED,
-        title=f"Suspicious {browser} extension: {name}",
+        title=f"Suspicious {browser_name} extension: {name}",
         details=(
-            f"{browser} extension '{name}' requests multiple sensitive permissions: {perms_list}. "
+            f"{browser_name} extension '{name}' requests multiple sensitive permissions: {perms_list}. "
             "The combination of these permissions could be used for tracking, data collection, or malicious activity."
         ),
         path=path,
         evidence={
-            "browser": browser.lower(),
+            "browser": browser_lower,
             "extension_name": name,
             "suspicious_permissions": perms_list,
             "extension_id": extension.get("id", ""),
         },
-        recommendation=(
-            "Review whether this extension needs all these permissions. "
-            "Consider alternatives with fewer permissions or remove if not essential."
-        )
+        recommendation=_REC_EXT_SUSPICIOUS
     )
 
 
@@ -1127,12 +1519,13 @@ def _create_extension_info_finding(
     extension: dict,
     finding_id: str,
     permissions: List[str],
-    host_permissions: List[str]
+    host_permissions: List[str],
+    name: str = "Unknown",
+    browser_name: str = "Unknown",
+    browser_lower: str = "unknown",
+    path: str = ""
 ) -> Finding:
     """Create an INFO finding for browser extension (awareness)."""
-    name = extension.get("name", "Unknown")
-    browser = extension.get("browser", "unknown").capitalize()
-    path = extension.get("manifest_path", "")
     version = extension.get("version", "unknown")
     
     perm_count = len(permissions) + len(host_permissions)
@@ -1141,23 +1534,20 @@ def _create_extension_info_finding(
         id=finding_id,
         category="browser_extension",
         risk=Risk.INFO,
-        title=f"{browser} extension: {name}",
+        title=f"{browser_name} extension: {name}",
         details=(
-            f"{browser} extension '{name}' (v{version}) is installed with {perm_count} permissions. "
+            f"{browser_name} extension '{name}' (v{version}) is installed with {perm_count} permissions. "
             "Browser extensions can access sensitive data and modify web pages."
         ),
         path=path,
         evidence={
-            "browser": browser.lower(),
+            "browser": browser_lower,
             "extension_name": name,
             "version": version,
             "permissions": ", ".join(permissions) if permissions else "None",
-            "host_permissions": ", ".join(host_permissions[:3]) if host_permissions else "None",
+            "host_permissions": ", ".join(islice(host_permissions, 3)) if host_permissions else "None",
             "extension_id": extension.get("id", ""),
         },
-        recommendation=(
-            "Periodically review installed browser extensions and remove those no longer needed. "
-            "Only install extensions from trusted sources."
-        )
+        recommendation=_REC_EXT_INFO
     )
 
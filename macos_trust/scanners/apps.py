@@ -2,6 +2,8 @@
 
 import os
 import plistlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -24,30 +26,56 @@ def scan_applications() -> list[dict]:
         >>> [app for app in apps if 'Safari' in app['name']]
         [{'app_path': '/Applications/Safari.app', 'exec_path': '...', ...}]
     """
-    apps = []
-    
     # Locations to scan for applications
     scan_paths = [
         Path("/Applications"),
         Path.home() / "Applications"
     ]
-    
+
+    # Enumerate candidate bundles first, then process them concurrently:
+    # each bundle is an independent stat + plist read that blocks on disk
+    # I/O, so a thread pool overlaps the reads instead of serializing them
+    candidates: list[Path] = []
+    seen: set[tuple[int, int]] = set()
     for scan_path in scan_paths:
         if not scan_path.exists():
             continue
-        
+
         try:
-            # Find all .app directories in this location
-            for item in scan_path.iterdir():
-                if item.is_dir() and item.suffix == ".app":
-                    app_info = _process_app_bundle(item)
-                    if app_info:
-                        apps.append(app_info)
+            # Find all .app directories in this location. os.scandir
+            # exposes the directory-entry type, so checking the name
+            # first and then is_dir() (which reuses the cached entry
+            # type, still following symlinks for Homebrew Cask links)
+            # avoids a Path allocation and stat for every non-app entry
+            with os.scandir(scan_path) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith(".app") and entry.is_dir()):
+                        continue
+
+                    # Dedupe by (device, inode): a bundle symlinked into
+                    # both /Applications and ~/Applications resolves to
+                    # the same key, so it's only processed once
+                    try:
+                        st = entry.stat()
+                        key = (st.st_dev, st.st_ino)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    except OSError:
+                        pass
+
+                    candidates.append(Path(entry.path))
         except (OSError, PermissionError):
             # Skip directories we can't read
             continue
-    
-    return apps
+
+    if not candidates:
+        return []
+
+    # _process_app_bundle handles its own errors, so map never raises and
+    # results come back in directory order
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+        return [app for app in executor.map(_process_app_bundle, candidates) if app]
 
 
 def _process_app_bundle(app_path: Path) -> dict | None:
@@ -60,51 +88,80 @@ def _process_app_bundle(app_path: Path) -> dict | None:
     Returns:
         Dictionary with app metadata, or None if processing fails critically
     """
-    # Extract app name from bundle name
+    # Work on the string form: every path built here ends up as a string
+    # in the result anyway, and plain concatenation skips the PurePath
+    # objects a `/`-chain would allocate per bundle
+    app_path_str = str(app_path)
     app_name = app_path.stem  # e.g., "Safari.app" -> "Safari"
-    
+
     # Initialize result with known values
     result = {
-        "app_path": str(app_path),
+        "app_path": app_path_str,
         "exec_path": "",
         "bundle_id": "",
         "name": app_name
     }
-    
-    # Try to read Info.plist
-    info_plist_path = app_path / "Contents" / "Info.plist"
-    
-    if not info_plist_path.exists():
-        # No Info.plist - return minimal info
-        return result
-    
+
+    # Try to read Info.plist. The stat doubles as the existence check and
+    # supplies the cache key for the parsed fields.
+    info_plist_path = app_path_str + "/Contents/Info.plist"
+
     try:
-        with open(info_plist_path, "rb") as f:
-            plist_data = plistlib.load(f)
-    except (OSError, plistlib.InvalidFileException, PermissionError, Exception):
-        # Can't read or parse plist (including XML parsing errors) - return minimal info
+        st = os.stat(info_plist_path)
+    except OSError:
+        # No Info.plist (or unreadable) - return minimal info
         return result
-    
-    # Extract bundle identifier
-    bundle_id = plist_data.get("CFBundleIdentifier", "")
+
+    bundle_id, executable_name, display_name = _load_plist_fields(
+        info_plist_path, st.st_mtime_ns, st.st_size
+    )
+
     if bundle_id:
         result["bundle_id"] = bundle_id
-    
-    # Extract executable name and resolve path
-    executable_name = plist_data.get("CFBundleExecutable", "")
-    
+
     if executable_name:
         # Standard location: <App>.app/Contents/MacOS/<CFBundleExecutable>
-        exec_path = app_path / "Contents" / "MacOS" / executable_name
-        
+        exec_path = f"{app_path_str}/Contents/MacOS/{executable_name}"
+
         # Check if executable exists
-        if exec_path.exists():
-            result["exec_path"] = str(exec_path)
+        if os.path.exists(exec_path):
+            result["exec_path"] = exec_path
         # If it doesn't exist, exec_path remains empty string
-    
+
     # Use CFBundleName or CFBundleDisplayName if available for better name
-    display_name = plist_data.get("CFBundleDisplayName") or plist_data.get("CFBundleName")
     if display_name:
         result["name"] = display_name
-    
+
     return result
+
+
+@lru_cache(maxsize=2048)
+def _load_plist_fields(path: str, mtime_ns: int, size: int) -> tuple[str, str, str]:
+    """
+    Parse an Info.plist and return (bundle_id, executable_name, display_name).
+
+    Keyed on (path, mtime, size) so repeated scans in the same process
+    skip the plistlib parse for bundles that haven't changed, while an
+    updated Info.plist gets a fresh key and can never serve stale fields.
+    Parse failures cache empty fields, matching the uncached behavior.
+    """
+    try:
+        with open(path, "rb") as f:
+            # Most Info.plists on disk are binary; naming the format
+            # skips plistlib's sniffing pass. Anything without the magic
+            # falls back to the auto-detecting (XML) path.
+            if f.read(8) == b"bplist00":
+                f.seek(0)
+                plist_data = plistlib.load(f, fmt=plistlib.FMT_BINARY)
+            else:
+                f.seek(0)
+                plist_data = plistlib.load(f)
+    except (OSError, plistlib.InvalidFileException, PermissionError, Exception):
+        # Can't read or parse plist (including XML parsing errors)
+        return ("", "", "")
+
+    return (
+        plist_data.get("CFBundleIdentifier", ""),
+        plist_data.get("CFBundleExecutable", ""),
+        plist_data.get("CFBundleDisplayName") or plist_data.get("CFBundleName") or "",
+    )
@@ -1,5 +1,6 @@
 """Known vendor information and trust metadata."""
 
+from functools import lru_cache
 from typing import Dict
 
 # Known legitimate vendors by Team ID
@@ -46,6 +47,12 @@ USER_WRITABLE_PATHS = [
 ]
 
 
+# The vendor predicates are plain dict probes -- KNOWN_VENDORS is a dict,
+# so membership and name lookup are already single O(1) hash hits and a
+# memoization layer would only add wrapper overhead. The path predicates
+# below do real substring work per call, so those stay memoized: scans hit
+# the same helper paths over and over (dozens of helpers per vendor).
+
 def is_known_vendor(team_id: str) -> bool:
     """Check if a Team ID belongs to a known vendor."""
     return team_id in KNOWN_VENDORS
@@ -56,6 +63,16 @@ def get_vendor_name(team_id: str) -> str:
     return KNOWN_VENDORS.get(team_id, team_id)
 
 
+def lookup_vendor(team_id: str) -> str | None:
+    """
+    Get vendor name for a known Team ID, or None if unknown.
+
+    Fuses is_known_vendor + get_vendor_name into a single table lookup.
+    """
+    return KNOWN_VENDORS.get(team_id)
+
+
+@lru_cache(maxsize=4096)
 def is_system_helper_path(path: str) -> bool:
     """Check if a path indicates a system helper/service."""
     if not path:
@@ -63,6 +80,7 @@ def is_system_helper_path(path: str) -> bool:
     return any(pattern in path for pattern in SYSTEM_HELPER_PATTERNS)
 
 
+@lru_cache(maxsize=4096)
 def is_user_writable_path(path: str) -> bool:
     """Check if a path is in a user-writable location."""
     if not path:
@@ -257,6 +257,46 @@ class TestRules(unittest.TestCase):
         if findings:
             self.assertIn("spctl", findings[0].id.lower())
     
+    def test_analyze_apps_batch(self):
+        """Test batch app analysis over parallel collector result lists."""
+        from macos_trust.rules import analyze_apps_batch
+
+        apps = [
+            {
+                "app_path": "/Applications/Unsigned.app",
+                "name": "Unsigned",
+                "bundle_id": "com.test.unsigned"
+            },
+            {
+                "app_path": "/Applications/Clean.app",
+                "name": "Clean",
+                "bundle_id": "com.test.clean"
+            },
+            {
+                "app_path": "/Applications/Broken.app",
+                "name": "Broken",
+                "bundle_id": "com.test.broken"
+            }
+        ]
+
+        # The malformed collector result for Broken.app makes its analysis
+        # raise; the batch must skip it without dropping the other apps
+        codesign_results = [
+            {"status": "fail", "error": "code object is not signed at all"},
+            None,
+            "not-a-dict"
+        ]
+        spctl_results = [None, None, None]
+        quarantine_results = [None, None, None]
+
+        # entitlements_results defaults to None (no entitlements data)
+        findings = analyze_apps_batch(apps, codesign_results, spctl_results, quarantine_results)
+        self.assertIsInstance(findings, list)
+        # Only the first app has collector results, so only it can produce findings
+        self.assertTrue(all(f.id.startswith("app:com.test.unsigned") for f in findings))
+        if findings:
+            self.assertIn("codesign", findings[0].id.lower())
+
     def test_analyze_launchd(self):
         """Test LaunchD item analysis."""
         from macos_trust.rules import analyze_launchd
@@ -338,6 +378,89 @@ class TestOutput(unittest.TestCase):
         self.assertIsInstance(output, str)
         self.assertIn("macOS Trust Scanner", output)
 
+    def test_render_human_flags(self):
+        """Test the detailed and color flags of render_human."""
+        from macos_trust.output.render import render_human
+        from macos_trust.models import ScanReport, HostInfo, Finding, Risk
+        from datetime import datetime
+
+        host = HostInfo(
+            hostname="test-host",
+            os_version="15.0",
+            build="24A5264n",
+            arch="arm64"
+        )
+
+        finding = Finding(
+            id="test:finding",
+            risk=Risk.HIGH,
+            category="test",
+            title="Test finding",
+            details="Test description",
+            recommendation="Test recommendation",
+            evidence={},
+            path="/test/path"
+        )
+
+        report = ScanReport(
+            timestamp=datetime.now().isoformat(),
+            host=host,
+            findings=[finding]
+        )
+
+        # Defaults: per-finding panels present, ANSI escapes for terminals
+        output = render_human(report)
+        self.assertIn("Detailed Analysis", output)
+        self.assertIn("\x1b", output)
+
+        # detailed=False skips the Detailed Analysis section
+        output = render_human(report, detailed=False)
+        self.assertNotIn("Detailed Analysis", output)
+        self.assertIn("Test finding", output)
+
+        # color=False emits plain text with no ANSI escapes
+        output = render_human(report, color=False)
+        self.assertNotIn("\x1b", output)
+        self.assertIn("Test finding", output)
+
+    def test_format_json_modes(self):
+        """Test compact default and pretty mode of format_json."""
+        from macos_trust.output.formatters import format_json
+        import json
+
+        results = [{"item": {"name": "Test", "type": "app"}}]
+        metadata = {"timestamp": "2025-01-01T00:00:00", "tool_version": "1.0"}
+
+        # Default is compact: no indentation and no spaces after separators
+        compact = format_json(results, metadata)
+        self.assertNotIn("\n", compact)
+        self.assertNotIn(": ", compact)
+        self.assertEqual(json.loads(compact)["results"], results)
+
+        # pretty=True produces indented output with the same payload
+        pretty = format_json(results, metadata, pretty=True)
+        self.assertIn("\n", pretty)
+        self.assertEqual(json.loads(pretty), json.loads(compact))
+
+    def test_save_json_matches_format_json(self):
+        """Test that save_json writes the same bytes format_json returns."""
+        from macos_trust.output.formatters import format_json, save_json
+        import os
+        import tempfile
+
+        results = [{"item": {"name": "Test", "type": "app"}}]
+        metadata = {"timestamp": "2025-01-01T00:00:00", "tool_version": "1.0"}
+
+        for pretty in (False, True):
+            fd, path = tempfile.mkstemp(suffix=".json")
+            os.close(fd)
+            try:
+                save_json(results, metadata, path, pretty=pretty)
+                with open(path) as f:
+                    self.assertEqual(f.read(), format_json(results, metadata, pretty=pretty))
+            finally:
+                os.unlink(path)
+
 
 class TestSARIFOutput(unittest.TestCase):
     """Test SARIF output rendering."""
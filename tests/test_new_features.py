@@ -692,5 +692,47 @@ class TestIntegration(unittest.TestCase):
                 baseline_path.unlink()
 
 
+class TestHTMLReport(unittest.TestCase):
+    """Test HTML report generation."""
+
+    def test_vendor_chart_counts_developer_id_application_source(self):
+        """Test that 'Developer ID Application: ...' sources reach the vendor chart."""
+        from macos_trust.output.html import generate_html_report
+
+        findings = [
+            {
+                "id": "app:com.example.tool:spctl_rejected",
+                "category": "app",
+                "risk": "MED",
+                "title": "Gatekeeper blocked: Tool",
+                "details": "Test",
+                "path": "/Applications/Tool.app",
+                "recommendation": "This is signed by Example Corp (Team ID: ABC1234567).",
+                "evidence": {
+                    # spctl's origin= fallback produces this shape; it must
+                    # fall through to the recommendation heuristic, not be
+                    # dropped from the vendor counts
+                    "spctl_source": "Developer ID Application: Example Corp (ABC1234567)",
+                    "spctl_team_id": "ABC1234567"
+                }
+            }
+        ]
+        metadata = {
+            "hostname": "test-host",
+            "os_version": "15.0",
+            "arch": "arm64",
+            "timestamp": "2025-01-01T00:00:00"
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "report.html"
+            generate_html_report(findings, metadata, output_path)
+            html = output_path.read_text(encoding="utf-8")
+
+        # The vendor chart labels are JSON-encoded into the template, so a
+        # quoted match can't be satisfied by the recommendation text alone
+        self.assertIn('["Example Corp"]', html)
+
+
 if __name__ == '__main__':
     unittest.main()